@@ -17,7 +17,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ── project root on path ────────────────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -184,13 +183,6 @@ def generate_fig4_10_total_demand_stacked_bar_twh(df: pd.DataFrame, output_dir:
     out_df = agg.rename(columns={"Year_cat": "Year", "Value": "TWh"})[["Year", "Sector", "TWh"]]
     out_df.to_csv(out_dir / f"{base_name}_data.csv", index=False)
 
-    # Gallery copy (optional)
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / f"{base_name}_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 
 # ── CLI ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":
@@ -13,7 +13,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 project_root = Path(__file__).resolve().parents[2]
 if str(project_root) not in sys.path:
@@ -117,12 +116,6 @@ def generate_fig4_11_wem_liquid_fuels_supply_area(df: pd.DataFrame, output_dir:
     save_figures(fig, output_dir, name="fig4_11_wem_liquid_fuels_supply_area")
     d.to_csv(out_dir / "fig4_11_wem_liquid_fuels_supply_area_data.csv", index=False)
 
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / "fig4_11_wem_liquid_fuels_supply_area_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "4_11_WEM_Liquid_fuels_supply.csv"
     if not data_path.exists():
@@ -4,7 +4,7 @@
 # FerroChrome Metal, Paper and Pulp, and Steel under NDC_BASE-RG, 2024–2035.
 # charts/chart_generators/fig4_19_heavy_industry_production_lines.py
 from __future__ import annotations
-import sys, re, shutil, yaml
+import sys, re, yaml
 from pathlib import Path
 import pandas as pd
 import plotly.express as px
@@ -124,12 +124,6 @@ def generate_fig4_19_heavy_industry_production_lines(df: pd.DataFrame, output_di
     save_figures(fig, output_dir, name="fig4_19_heavy_industry_production_lines")
     d.to_csv(out_dir / "fig4_19_heavy_industry_production_lines_data.csv", index=False)
 
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src = out_dir / "fig4_19_heavy_industry_production_lines_report.png"
-    if src.exists():
-        shutil.copy2(src, gallery_dir / src.name)
-
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "4_19_heavy_industry_production_Mt.csv"
     if not data_path.exists():
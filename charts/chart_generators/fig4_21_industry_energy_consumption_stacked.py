@@ -6,7 +6,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 project_root = Path(__file__).resolve().parents[2]
 if str(project_root) not in sys.path:
@@ -110,11 +109,6 @@ def generate_fig4_21_industry_energy_consumption(df: pd.DataFrame, output_dir: s
     save_figures(fig, output_dir, name="fig4_21_industry_energy_consumption")
     d.to_csv(outdir / "fig4_21_industry_energy_consumption_data.csv", index=False)
 
-    gallery = project_root / "outputs" / "gallery"; gallery.mkdir(parents=True, exist_ok=True)
-    img = outdir / "fig4_21_industry_energy_consumption_report.png"
-    if img.exists():
-        shutil.copy2(img, gallery / img.name)
-
 if __name__ == "__main__":
     if not DATA_FILE.exists():
         raise FileNotFoundError(f"Could not find {DATA_FILE}")
@@ -14,7 +14,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ── Easy-to-edit style knobs ───────────────────────────────────────────────────
 LEGEND_FONT_SIZE = 18   # ← edit this to change legend entry font size
@@ -143,13 +142,6 @@ def generate_fig4_22_industry_energy_ippu_emissions_area(df: pd.DataFrame, outpu
     save_figures(fig, output_dir, name="fig4_22_industry_energy_ippu_emissions_area")
     d.to_csv(out_dir / "fig4_22_industry_energy_ippu_emissions_area_data.csv", index=False)
 
-    # Copy preview to gallery
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / "fig4_22_industry_energy_ippu_emissions_area_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 # ── Script entry ────────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "4_22_industry_energy_ippu_emissions_area.csv"
@@ -14,7 +14,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 project_root = Path(__file__).resolve().parents[2]
 if str(project_root) not in sys.path:
@@ -177,12 +176,6 @@ def generate_fig4_25_residential_energy_by_income_pj(df: pd.DataFrame, output_di
     df_out["Year"] = df_out["Year"].astype(str)
     df_out.to_csv(out_dir / f"{base_name}_data.csv", index=False)
 
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / f"{base_name}_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "4_25_residential_energy_consump_by_income_cat_bar.csv"
     if not data_path.exists():
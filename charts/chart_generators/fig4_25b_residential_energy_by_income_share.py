@@ -13,7 +13,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ── project root on path ────────────────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -186,12 +185,6 @@ def generate_fig4_25_residential_energy_by_income_share(df: pd.DataFrame, output
     ].copy()
     out_df.to_csv(out_dir / f"{base_name}_data.csv", index=False)
 
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / f"{base_name}_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 # ── CLI ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "4_25_residential_energy_consump_by_income_cat_bar.csv"
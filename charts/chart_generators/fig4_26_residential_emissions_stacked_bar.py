@@ -15,7 +15,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ── project root on path ────────────────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -23,7 +22,7 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 from charts.common.style import apply_common_layout, color_for      # shared style
-from charts.common.save import save_figures                         # PNG+SVG saver
+from charts.common.save import save_figures                                 # PNG+SVG saver
 
 # ── config (dev mode) ───────────────────────────────────────────────
 config_path = project_root / "config.yaml"
@@ -158,13 +157,6 @@ def generate_fig4_26_residential_emissions_stacked_bar(df: pd.DataFrame, output_
     out_df = agg.rename(columns={"Fuel_canon": "Fuel", "Year_cat": "Year"})[["Year", "Fuel", "MtCO2eq"]]
     out_df.to_csv(out_dir / f"{base_name}_data.csv", index=False)
 
-    # copy PNG to gallery for quick reuse
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / f"{base_name}_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 
 # ── CLI ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":
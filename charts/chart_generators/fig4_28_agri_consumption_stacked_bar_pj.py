@@ -17,7 +17,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ── project root on path ────────────────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -164,13 +163,6 @@ def generate_fig4_28_agri_consumption_stacked_bar_pj(df: pd.DataFrame, output_di
     out_df = agg.rename(columns={"Fuel_canon": "Fuel", "Year_cat": "Year"})[["Year", "Fuel", "PJ"]]
     out_df.to_csv(out_dir / f"{base_name}_data.csv", index=False)
 
-    # optional gallery copy
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / f"{base_name}_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 
 # ── CLI ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":
@@ -14,7 +14,6 @@ import sys
 from pathlib import Path
 import pandas as pd
 import yaml
-import shutil
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
@@ -231,13 +230,6 @@ def generate_fig4_30_agri_land_emissions_area(df: pd.DataFrame, output_dir: str)
     save_figures(fig, str(out_dir), name=base)
     df.to_csv(out_dir / f"{base}_data.csv", index=False)
 
-    # Optional gallery copy
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src = out_dir / f"{base}_report.png"
-    if src.exists():
-        shutil.copy2(src, gallery_dir / src.name)
-
 # ── CLI ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "4_30_agri_land_emissions_area.csv"
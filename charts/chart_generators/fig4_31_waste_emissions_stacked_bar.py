@@ -11,11 +11,11 @@
 #   (Optional) --labels / --no-labels to toggle in-bar value labels.
 
 from __future__ import annotations
-import sys, re, argparse, shutil
+import sys, re, argparse
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import plotly.express as px
-import yaml
 
 # ── project root on path ────────────────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -24,13 +24,11 @@ if str(project_root) not in sys.path:
 
 from charts.common.style import apply_common_layout
 from charts.common.save import save_figures
+from charts.common.config import get_config, is_dev_mode
 
 # ── config ─────────────────────────────────────────────────────────
-_CFG = {}
-cfg_path = project_root / "config.yaml"
-if cfg_path.exists():
-    _CFG = yaml.safe_load(cfg_path.read_text(encoding="utf-8")) or {}
-dev_mode = bool(_CFG.get("dev_mode", False))
+_CFG = get_config()
+dev_mode = is_dev_mode()
 
 # labels toggle (default OFF here; CLI can override)
 SHOW_LABELS = bool(_CFG.get("charts", {}).get("value_labels", True))
@@ -105,13 +103,17 @@ def generate_fig4_31_waste_emissions_stacked_bar(df: pd.DataFrame, output_dir: s
     df["IPCC_L2_disp"] = df["IPCC_L2"].apply(_legend_label)
 
     # types & filter
-    df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype("Int64")
+    df["Year"] = pd.to_numeric(df["Year"], errors="coerce").astype("Int32")
     df["MtCO2eq"] = pd.to_numeric(df["MtCO2eq"], errors="coerce").fillna(0.0)
+    # categorical keys keep the groupbys on integer codes
+    df["IPCC_L2"] = df["IPCC_L2"].astype("category")
+    df["IPCC_L2_disp"] = df["IPCC_L2_disp"].astype("category")
     df = df[df["Year"].isin(YEAR_ORDER)].copy()
 
     # aggregate for plotting (use wrapped display labels)
     agg = (
-        df.groupby(["Year", "IPCC_L2_disp"], as_index=False)["MtCO2eq"].sum()
+        df.groupby(["Year", "IPCC_L2_disp"], as_index=False, observed=True)["MtCO2eq"].sum()
+          .assign(MtCO2eq=lambda x: x["MtCO2eq"].astype("float32"))
           .sort_values(["Year", "IPCC_L2_disp"])
     )
 
@@ -126,9 +128,8 @@ def generate_fig4_31_waste_emissions_stacked_bar(df: pd.DataFrame, output_dir: s
     color_map = {_legend_label(k): _LOCAL_COLORS.get(k, "#888888") for k in _LOCAL_COLORS}
 
     # labels (threshold to avoid clutter)
-    def _fmt(v: float) -> str:
-        return f"{v:.1f}" if v >= 0.5 else ""
-    agg["label"] = agg["MtCO2eq"].apply(_fmt)
+    vals = agg["MtCO2eq"].to_numpy()
+    agg["label"] = np.where(vals >= 0.5, np.char.mod("%.1f", vals), "")
 
     # figure
     fig = px.bar(
@@ -187,16 +188,11 @@ def generate_fig4_31_waste_emissions_stacked_bar(df: pd.DataFrame, output_dir: s
 
     # Write clean (unwrapped) data table
     out_df = (
-        df.groupby(["Year", "IPCC_L2"], as_index=False)["MtCO2eq"].sum()
+        df.groupby(["Year", "IPCC_L2"], as_index=False, observed=True)["MtCO2eq"].sum()
           .sort_values(["Year", "IPCC_L2"])
     )
     out_df.to_csv(out_dir / f"{base}_data.csv", index=False)
 
-    # gallery copy (optional)
-    gal = project_root / "outputs" / "gallery"; gal.mkdir(parents=True, exist_ok=True)
-    p = out_dir / f"{base}_report.png"
-    if p.exists(): shutil.copy2(p, gal / p.name)
-
 
 # ── CLI ─────────────────────────────────────────────────────────────
 if __name__ == "__main__":
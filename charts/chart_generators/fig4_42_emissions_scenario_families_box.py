@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -162,12 +162,6 @@ def generate_fig4_42_emissions_scenario_families_box(df: pd.DataFrame, output_di
         save_figures(fig, str(out), name="fig4_42_emissions_scenario_families_box")
         df.to_csv(out / "fig4_42_emissions_scenario_families_box_data.csv", index=False)
 
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig4_42_emissions_scenario_families_box_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
-
 # ── CLI ─────────────────────────────────────────────────────────
 if __name__ == "__main__":
     default_csv = PROJECT_ROOT / "data" / "processed" / "4_42_emissions_scenario_families_2035.csv"
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd
 import plotly.express as px
 
@@ -159,12 +159,6 @@ def generate_fig4_4_1_scatter_elec_vs_total(df: pd.DataFrame, output_dir: str) -
         out.mkdir(parents=True, exist_ok=True)
         df.to_csv(out / "fig4_4_1_scatter_elec_vs_total_data.csv", index=False)
 
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig4_4_1_scatter_elec_vs_total_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
-
 # ───────────────────── CLI ─────────────────────
 if __name__ == "__main__":
     default_csv = PROJECT_ROOT / "data" / "processed" / "4.4.1_scatter_elec_emissions_vs_total.csv"
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd
 import plotly.express as px
 
@@ -180,11 +180,6 @@ def generate_fig4_4_emissions_under_300mt_lines(df: pd.DataFrame, output_dir: st
         save_figures(fig, str(out), name="fig4_4_emissions_under_300mt_lines")
         out.mkdir(parents=True, exist_ok=True)
         df.to_csv(out / "fig4_4_emissions_under_300mt_lines_data.csv", index=False)
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig4_4_emissions_under_300mt_lines_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
 
 # ───────────── CLI ─────────────
 if __name__ == "__main__":
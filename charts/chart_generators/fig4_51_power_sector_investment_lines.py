@@ -11,7 +11,7 @@
 # Legend on the right (no title), orange label wraps after "300Mt" and uses CO₂.
 
 from __future__ import annotations
-import sys, re, yaml, shutil
+import sys, re, yaml
 from pathlib import Path
 import pandas as pd
 import plotly.express as px
@@ -171,12 +171,6 @@ def generate_fig4_51_power_sector_investment_lines(df: pd.DataFrame, output_dir:
     save_figures(fig, output_dir, name="fig4_51_power_sector_investment_lines")
     d.to_csv(out_dir / "fig4_51_power_sector_investment_lines_data.csv", index=False)
 
-    gallery_dir = project_root / "outputs" / "gallery"
-    gallery_dir.mkdir(parents=True, exist_ok=True)
-    src_img = out_dir / "fig4_51_power_sector_investment_lines_report.png"
-    if src_img.exists():
-        shutil.copy2(src_img, gallery_dir / src_img.name)
-
 # ── CLI entry ───────────────────────────────────────────────────────
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "4_51_power_sector_investment.csv"
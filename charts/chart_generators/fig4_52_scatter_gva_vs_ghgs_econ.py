@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd
 import plotly.express as px
 
@@ -183,12 +183,6 @@ def generate_fig4_52_scatter_gva_vs_ghgs(df: pd.DataFrame, output_dir: str) -> N
         out.mkdir(parents=True, exist_ok=True)
         df.to_csv(out / "fig4_52_scatter_gva_vs_ghgs_data.csv", index=False)
 
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig4_52_scatter_gva_vs_ghgs_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
-
 # ───────────────────── CLI ─────────────────────
 if __name__ == "__main__":
     default_csv = PROJECT_ROOT / "data" / "processed" / "GVA_v_Emissions_scenarios.csv"
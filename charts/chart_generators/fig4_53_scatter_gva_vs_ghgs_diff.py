@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd
 import plotly.express as px
 
@@ -162,11 +162,6 @@ def generate_fig4_53_scatter_gva_vs_ghgs_diff(df: pd.DataFrame, output_dir: str)
         save_figures(fig, str(out), name="fig4_53_scatter_gva_vs_ghgs_diff")
         out.mkdir(parents=True, exist_ok=True)
         df.to_csv(out / "fig4_53_scatter_gva_vs_ghgs_diff_data.csv", index=False)
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig4_53_scatter_gva_vs_ghgs_diff_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
 
 # ───── CLI ─────
 if __name__ == "__main__":
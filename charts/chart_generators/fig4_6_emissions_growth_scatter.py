@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd
 import plotly.express as px
 
@@ -168,12 +168,6 @@ def generate_fig4_6_emissions_growth_scatter(
         out.mkdir(parents=True, exist_ok=True)
         df.to_csv(out / "fig4_6_emissions_growth_scatter_data.csv", index=False)
 
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig4_6_emissions_growth_scatter_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
-
 # ── CLI ──
 if __name__ == "__main__":
     default_csv = PROJECT_ROOT / "data" / "processed" / "4_6_emissions_econ_growth_rates_categories_scatter_2035.csv"
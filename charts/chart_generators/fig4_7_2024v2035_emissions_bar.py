@@ -2,7 +2,6 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil
 import yaml
 import pandas as pd
 import plotly.express as px
@@ -20,7 +19,7 @@ except Exception:
         return fig
 
 try:
-    from charts.common.save import save_figures           # expects (fig, out_dir, name)
+    from charts.common.save import save_figures                   # expects (fig, out_dir, name)
 except Exception:
     def save_figures(fig, out_dir: str, name: str):
         out = Path(out_dir)
@@ -148,13 +147,6 @@ def generate_fig4_7_2024v2035_emissions_bar(df: pd.DataFrame, output_dir: str) -
         out.mkdir(parents=True, exist_ok=True)
         data.to_csv(out / "fig4_7_2024v2035_emissions_bar_data.csv", index=False)
 
-        # Optional: copy PNG to gallery
-        png = out / "fig4_7_2024v2035_emissions_bar_report.png"
-        gallery = PROJECT_ROOT / "outputs" / "gallery"
-        if png.exists():
-            gallery.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(png, gallery / png.name)
-
 
 # ──────────────────────────── CLI ────────────────────────────
 if __name__ == "__main__":
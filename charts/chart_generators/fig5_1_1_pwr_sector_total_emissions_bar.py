@@ -5,7 +5,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ───────────────────────── Safe Import Path ─────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -160,12 +159,6 @@ def generate_fig5_3_sectoral_vs_wem_difference_emissions_bar_final_v7(df: pd.Dat
         save_figures(fig, output_dir, name="fig5_3_sectoral_vs_wem_difference_emissions_bar_final_v7")
         df.to_csv(Path(output_dir) / "fig5_3_sectoral_vs_wem_difference_emissions_bar_final_v7_data.csv", index=False)
 
-        gallery_dir = project_root / "outputs" / "gallery"
-        gallery_dir.mkdir(parents=True, exist_ok=True)
-        src_img = Path(output_dir) / "fig5_3_sectoral_vs_wem_difference_emissions_bar_final_v7_report.png"
-        if src_img.exists():
-            shutil.copy(src_img, gallery_dir / src_img.name)
-
 
 # ───────────────────────── Entry Point ─────────────────────────
 if __name__ == "__main__":
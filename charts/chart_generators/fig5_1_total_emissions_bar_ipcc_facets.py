@@ -11,7 +11,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ───────────────────────── Safe Import Path ─────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -142,11 +141,6 @@ def generate_fig_ndc_ghg_emission_cats_gen(df: pd.DataFrame, output_dir: str) ->
         print("💾 saving figure and data")
         save_figures(fig, output_dir, name="fig_ndc_ghg_emission_cats_gen")
         df.to_csv(Path(output_dir) / "fig_ndc_ghg_emission_cats_gen_data.csv", index=False)
-        gallery_dir = project_root / "outputs" / "gallery"
-        gallery_dir.mkdir(parents=True, exist_ok=True)
-        src_img = Path(output_dir) / "fig_ndc_ghg_emission_cats_gen_report.png"
-        if src_img.exists():
-            shutil.copy(src_img, gallery_dir / src_img.name)
 
 
 # ───────────────────────── Entry Point ─────────────────────────
@@ -13,7 +13,6 @@ from charts.common.style import apply_common_layout, color_for
 from charts.common.save import save_figures
 from utils.mappings import map_scenario_key
 import yaml
-import shutil
 
 # ────────────────────────── Config ────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -127,13 +126,6 @@ def generate_fig5_2_1_sarem_capacity(df: pd.DataFrame, output_dir: str) -> None:
         print("💾 saving figure and data")
         save_figures(fig, output_dir, name="fig5_2_1_sarem_capacity")
 
-        # Copy main image into gallery
-        gallery_dir = project_root / "outputs" / "gallery"
-        gallery_dir.mkdir(parents=True, exist_ok=True)
-        src_img = Path(output_dir) / "fig5_2_1_sarem_capacity_report.png"
-        if src_img.exists():
-            shutil.copy(src_img, gallery_dir / src_img.name)
-
         # Export CSV snapshot used to plot
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         df.to_csv(Path(output_dir) / "fig5_2_1_sarem_capacity_data.csv", index=False)
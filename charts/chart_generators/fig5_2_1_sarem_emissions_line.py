@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd, plotly.express as px
 
 if __name__ == "__main__" and __package__ is None:
@@ -64,9 +64,6 @@ def generate_fig5_2_1_sarem_emissions_line(df: pd.DataFrame, output_dir: str)->N
     if not DEV_MODE:
         save_figures(fig,str(out),name="fig5_2_1_sarem_emissions_line")
         out.mkdir(parents=True,exist_ok=True); df.to_csv(out/"fig5_2_1_sarem_emissions_line_data.csv",index=False)
-        gal=PROJECT_ROOT/"outputs"/"gallery"; gal.mkdir(parents=True,exist_ok=True)
-        png=out/"fig5_2_1_sarem_emissions_line_report.png"
-        if png.exists(): shutil.copy2(png,gal/png.name)
 
 if __name__=="__main__":
     csv=PROJECT_ROOT/"data"/"processed"/"5.2.1_SAREM_emissions_line.csv"
@@ -14,7 +14,7 @@ from plotly.subplots import make_subplots
 from charts.common.style import apply_common_layout, color_for
 from charts.common.save import save_figures
 from utils.mappings import map_scenario_key
-import yaml, shutil
+import yaml
 
 # ─────────── Config
 project_root = Path(__file__).resolve().parents[2]
@@ -186,10 +186,6 @@ def generate_fig5_3_9_ee_combo_hstack(df_pj, df_twh, output_dir: str) -> None:
         print("👩‍💻 dev_mode ON — showing chart only (no export)")
     else:
         save_figures(combo, output_dir, name="fig5_3_9_ee_combo_hstack")
-        gal = project_root / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        src = Path(output_dir) / "fig5_3_9_ee_combo_hstack_report.png"
-        if src.exists(): shutil.copy(src, gal / src.name)
         # Save exact plotting tables
         df_pj.to_csv(Path(output_dir) / "fig5_3_9_ee_combo_hstack_primary_pj_data.csv", index=False)
         df_twh.to_csv(Path(output_dir) / "fig5_3_9_ee_combo_hstack_electricity_twh_data.csv", index=False)
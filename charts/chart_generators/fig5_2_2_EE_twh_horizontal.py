@@ -12,7 +12,7 @@ import plotly.express as px
 from charts.common.style import apply_common_layout, color_for
 from charts.common.save import save_figures
 from utils.mappings import map_scenario_key
-import yaml, shutil
+import yaml
 
 # Config
 project_root = Path(__file__).resolve().parents[2]
@@ -105,10 +105,6 @@ def generate_fig5_3_9_ee_twh_h(df: pd.DataFrame, output_dir: str) -> None:
         print("dev_mode ON (no export)")
     else:
         save_figures(fig, output_dir, name="fig5_3_9_ee_twh_h")
-        gallery = project_root / "outputs" / "gallery"
-        gallery.mkdir(parents=True, exist_ok=True)
-        src = Path(output_dir) / "fig5_3_9_ee_twh_h_report.png"
-        if src.exists(): shutil.copy(src, gallery / src.name)
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         df.to_csv(Path(output_dir) / "fig5_3_9_ee_twh_h_data.csv", index=False)
 
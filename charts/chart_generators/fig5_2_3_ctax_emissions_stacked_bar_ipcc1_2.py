@@ -5,7 +5,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ────────────────────────── Safe Import Fallback ──────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -149,12 +148,6 @@ def generate_fig5_2_3_ctax_emissions_stacked_bar_ipcc1(df: pd.DataFrame, output_
         print("💾 saving figure and data")
         save_figures(fig, output_dir, name="fig5_2_3_ctax_emissions_stacked_bar_ipcc1")
 
-        gallery_dir = project_root / "outputs" / "gallery"
-        gallery_dir.mkdir(parents=True, exist_ok=True)
-        src_img = Path(output_dir) / "fig5_2_3_ctax_emissions_stacked_bar_ipcc1_report.png"
-        if src_img.exists():
-            shutil.copy(src_img, gallery_dir / src_img.name)
-
         df.to_csv(Path(output_dir) / "fig5_2_3_ctax_emissions_stacked_bar_ipcc1_data.csv", index=False)
 
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd, plotly.express as px
 
 # Allow shared imports when run directly
@@ -145,11 +145,6 @@ def generate_fig5_2_1_wem_freim_passm_lines(df: pd.DataFrame, output_dir: str) -
         save_figures(fig, str(out), name="fig5_2_1_wem_freim_passm_lines")
         out.mkdir(parents=True, exist_ok=True)
         df.to_csv(out / "fig5_2_1_wem_freim_passm_lines_data.csv", index=False)
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig5_2_1_wem_freim_passm_lines_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
 
 # ──────────────── CLI (convenience) ────────────────
 if __name__ == "__main__":
@@ -5,7 +5,6 @@ from pathlib import Path
 import pandas as pd
 import plotly.express as px
 import yaml
-import shutil
 
 # ───────────────────────── Safe Import Path ─────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -152,12 +151,6 @@ def generate_fig5_3_3_pwr_scen_families_bar_emissions_mtco2eq(df: pd.DataFrame,
         print("💾 saving figure and data")
         save_figures(fig, output_dir, name="fig5_3_3_pwr_scen_families_bar_emissions_mtco2eq")
 
-        gallery_dir = project_root / "outputs" / "gallery"
-        gallery_dir.mkdir(parents=True, exist_ok=True)
-        src_img = Path(output_dir) / "fig5_3_3_pwr_scen_families_bar_emissions_mtco2eq_report.png"
-        if src_img.exists():
-            shutil.copy(src_img, gallery_dir / src_img.name)
-
         df.to_csv(Path(output_dir) / "fig5_3_3_pwr_scen_families_bar_emissions_mtco2eq_data.csv", index=False)
 
 
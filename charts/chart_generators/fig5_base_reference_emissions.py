@@ -33,17 +33,17 @@ def generate_fig5_base_reference_emissions(df: pd.DataFrame, output_dir: str) ->
 
     data = (
         filtered
-        .groupby(["Scenario", "Year"])["CO2eq"]
+        .groupby(["Scenario", "Year"], observed=True)["CO2eq"]
         .sum()
         .reset_index()
     )
 
+    # data is already sorted by Scenario, so sort=False keeps the legend order
     fig = go.Figure()
-    for scenario in data["Scenario"].unique():
-        subset = data[data["Scenario"] == scenario]
+    for scenario, subset in data.groupby("Scenario", sort=False, observed=True):
         fig.add_trace(go.Scatter(
-            x=subset["Year"],
-            y=subset["CO2eq"],
+            x=subset["Year"].to_numpy(),
+            y=subset["CO2eq"].to_numpy(),
             mode="lines",
             name=scenario,
             line=dict(width=2)
@@ -13,6 +13,7 @@ if str(project_root) not in sys.path:
 
 from charts.common.style import apply_common_layout
 from charts.common.save import save_figures
+from utils.mappings import map_scenario_key
 
 # ── config
 config_path = project_root / "config.yaml"
@@ -23,6 +24,13 @@ if config_path.exists():
 else:
     dev_mode = False
 
+# dataset columns read by the generator (lets generate_charts.py skip the rest).
+# ScenarioKey isn't in the processed dataset; it is derived from Scenario below.
+# NB: the CarbonBudget / EconomicGrowth labels this chart filters on ("No Budget",
+# LG/RG/HG) don't match what generate_dataset.py writes (budget numbers or
+# "NoBudget"; Low/Reference/High), so it currently plots nothing from the dataset.
+REQUIRED_COLUMNS = ("Year", "Scenario", "EconomicGrowth", "CarbonBudget", "CO2eq")
+
 
 def generate_fig4_2_pane_emissions_by_scenario(df: pd.DataFrame, output_dir: str) -> None:
     """
@@ -39,6 +47,8 @@ def generate_fig4_2_pane_emissions_by_scenario(df: pd.DataFrame, output_dir: str
     dfx = df.copy()
     if "Year" in dfx.columns:
         dfx = dfx[dfx["Year"] == 2035]
+    if "ScenarioKey" not in dfx.columns:
+        dfx["ScenarioKey"] = dfx["Scenario"].map(map_scenario_key, na_action="ignore")
     dfx = dfx[cols].copy()
 
     # ---- NO RESCALE (data already in Mt) ----
@@ -17,6 +17,7 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from charts.common.style import apply_common_layout
 from charts.common.save import save_figures
+from utils.mappings import map_scenario_key
 
 
 # ── config
@@ -28,6 +29,13 @@ if config_path.exists():
 else:
     DEV_MODE = False
 
+# dataset columns read by the generator (lets generate_charts.py skip the rest).
+# ScenarioKey isn't in the processed dataset; it is derived from Scenario below.
+# NB: the CarbonBudget / EconomicGrowth labels this chart filters on ("No Budget",
+# LG/RG/HG) don't match what generate_dataset.py writes (budget numbers or
+# "NoBudget"; Low/Reference/High), so it currently plots nothing from the dataset.
+REQUIRED_COLUMNS = ("Year", "Scenario", "EconomicGrowth", "CarbonBudget", "CO2eq")
+
 
 def generate_fig_emissions_by_scenario_growth(df: pd.DataFrame, output_dir: str) -> None:
     """
@@ -49,6 +57,8 @@ def generate_fig_emissions_by_scenario_growth(df: pd.DataFrame, output_dir: str)
     # If Year exists, keep 2035 snapshot
     if "Year" in dfx.columns:
         dfx = dfx[dfx["Year"] == 2035].copy()
+    if "ScenarioKey" not in dfx.columns:
+        dfx["ScenarioKey"] = dfx["Scenario"].map(map_scenario_key, na_action="ignore")
 
     required = ["ScenarioKey", "EconomicGrowth", "CarbonBudget", "CO2eq"]
     missing = [c for c in required if c not in dfx.columns]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-import shutil, yaml
+import yaml
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -191,12 +191,6 @@ def generate_fig_scatter_2030_vs_2035_targets(df: pd.DataFrame, output_dir: str)
         out.mkdir(parents=True, exist_ok=True)
         df.to_csv(out / "fig_scatter_2030_vs_2035_targets_data.csv", index=False)
 
-        gal = PROJECT_ROOT / "outputs" / "gallery"
-        gal.mkdir(parents=True, exist_ok=True)
-        png = out / "fig_scatter_2030_vs_2035_targets_report.png"
-        if png.exists():
-            shutil.copy2(png, gal / png.name)
-
 # ───────────────────── CLI ─────────────────────
 if __name__ == "__main__":
     default_csv = PROJECT_ROOT / "data" / "processed" / "data_2030v2035NDCtargets.csv"
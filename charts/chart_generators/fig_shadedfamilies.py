@@ -8,29 +8,21 @@ if __name__ == "__main__" and __package__ is None:
     project_root = Path(__file__).resolve().parents[2]
     sys.path.insert(0, str(project_root))
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from charts.common.style import apply_common_layout, color_for, color_sequence
 from charts.common.save import save_figures
+from charts.common.config import is_dev_mode
 
-import yaml
-project_root = Path(__file__).resolve().parents[2]
-config_path = project_root / "config.yaml"
-if config_path.exists():
-    with open(config_path) as f:
-        _CFG = yaml.safe_load(f)
-    dev_mode = _CFG.get("dev_mode", False)
-else:
-    dev_mode = False
+dev_mode = is_dev_mode()
 
 
 def generate_fig_shadedscenarios(df: pd.DataFrame, output_dir: str) -> None:
     print("generating shaded figure of emissions from all scenarios")
 
-    years = list(range(2024, 2036))
-    
     scenario_year_emissions = (
-        df[df['Year'].isin(years)].groupby(['Scenario', 'ScenarioGroup', 'Year'])['CO2eq']
+        df[df['Year'].between(2024, 2035)].groupby(['Scenario', 'ScenarioGroup', 'Year'])['CO2eq']
         .sum()
         .reset_index(name='CO2eq_Total')
     )
@@ -65,9 +57,10 @@ def generate_fig_shadedscenarios(df: pd.DataFrame, output_dir: str) -> None:
     fig = go.Figure()
     for group in data['ScenarioGroup'].unique():
         d = data[data['ScenarioGroup'] == group]
+        years = d['Year'].to_numpy()
         fig.add_trace(go.Scatter(
-            x=pd.concat([d['Year'], d['Year'][::-1]]),
-            y=pd.concat([d['Emissions_min'], d['Emissions_max'][::-1]]),
+            x=np.concatenate([years, years[::-1]]),
+            y=np.concatenate([d['Emissions_min'].to_numpy(), d['Emissions_max'].to_numpy()[::-1]]),
             fill='toself',
             fillcolor=group_colors.get(group, 'rgba(128,128,128,0.2)'),
             line=dict(color='rgba(255,255,255,0)'),
@@ -80,8 +73,8 @@ def generate_fig_shadedscenarios(df: pd.DataFrame, output_dir: str) -> None:
             # since CPP is a few, use the average
             
             fig.add_trace(go.Scatter(
-                x=d['Year'],
-                y=d['Emissions_mean'],
+                x=years,
+                y=d['Emissions_mean'].to_numpy(),
                 line=dict(color=line_colors.get(group, 'gray'), width=2),
                 name=f'{group} Mean'
             ))
@@ -95,8 +88,8 @@ def generate_fig_shadedscenarios(df: pd.DataFrame, output_dir: str) -> None:
 
 
             fig.add_trace(go.Scatter(
-                x=d_scenario['Year'],
-                y=d_scenario['CO2eq_Total'],
+                x=d_scenario['Year'].to_numpy(),
+                y=d_scenario['CO2eq_Total'].to_numpy(),
                 line=dict(color=line_colors.get(group, 'gray'), width=2),
                 name=f'{group} Reference'
             )
@@ -106,8 +99,8 @@ def generate_fig_shadedscenarios(df: pd.DataFrame, output_dir: str) -> None:
                 scenario_year_emissions['Scenario'] == "NDC_HCARB-RG"]
             
             fig.add_trace(go.Scatter(
-                x=d_scenario['Year'],
-                y=d_scenario['CO2eq_Total'],
+                x=d_scenario['Year'].to_numpy(),
+                y=d_scenario['CO2eq_Total'].to_numpy(),
                 line=dict(color=line_colors.get(group, 'gray'), width=2),
                 name=f'{group} Reference'
             )
@@ -117,8 +110,8 @@ def generate_fig_shadedscenarios(df: pd.DataFrame, output_dir: str) -> None:
                 scenario_year_emissions['Scenario'] == "NDC_LCARB-RG"]
             scen_name = group
             fig.add_trace(go.Scatter(
-                x=d_scenario['Year'],
-                y=d_scenario['CO2eq_Total'],
+                x=d_scenario['Year'].to_numpy(),
+                y=d_scenario['CO2eq_Total'].to_numpy(),
                 line=dict(color=line_colors.get(group, 'gray'), width=2),
                 name=f'{group} Reference'
             )
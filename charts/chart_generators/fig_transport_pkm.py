@@ -11,19 +11,11 @@ import pandas as pd
 import plotly.express as px
 from charts.common.style import apply_common_layout
 from charts.common.save import save_figures
-import yaml
+from charts.common.config import is_dev_mode
 
 # ────────────────────────── Config ────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
-config_path = project_root / "config.yaml"
-
-if config_path.exists():
-    with open(config_path) as f:
-        _CFG = yaml.safe_load(f)
-    dev_mode = _CFG.get("dev_mode", False)
-else:
-    print("⚠️ config.yaml not found — defaulting dev_mode = False")
-    dev_mode = False
+dev_mode = is_dev_mode()
 
 
 # Custom vehicle colors (matching Tableau)
@@ -93,7 +85,8 @@ def generate_fig_transport_pkm(df: pd.DataFrame, output_dir: str) -> None:
     )
 
     # Clean up facet titles
-    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    for a in fig.layout.annotations:
+        a.text = a.text.split("=")[-1]
 
     # Save
     if dev_mode:
@@ -102,14 +95,21 @@ def generate_fig_transport_pkm(df: pd.DataFrame, output_dir: str) -> None:
     else:
         print("💾 saving figure and data")
         save_figures(fig, output_dir, name="fig_transport_pkm")
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
         df.to_csv(Path(output_dir) / "transport_pkm_data.csv", index=False)
 
 
 # ────────────────────────── Standalone run ─────────────────────────
 if __name__ == "__main__":
     data_path = project_root / "data" / "processed" / "transport passenger demand pkm.xlsx"
-    df = pd.read_excel(data_path)
+    # Parquet copy under .cache/ (data/ is LFS-tracked): the xlsx is parsed once,
+    # later runs read the parquet
+    cache_path = project_root / ".cache" / "xlsx" / f"{data_path.stem}.parquet"
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    if cache_path.exists() and cache_path.stat().st_mtime >= data_path.stat().st_mtime:
+        df = pd.read_parquet(cache_path, engine="pyarrow")
+    else:
+        df = pd.read_excel(data_path, engine="openpyxl")
+        df.to_parquet(cache_path, compression="zstd")
 
     out = project_root / "outputs" / "charts_and_data" / "fig_transport_pkm"
     out.mkdir(parents=True, exist_ok=True)
@@ -11,16 +11,9 @@ import pandas as pd
 import plotly.graph_objects as go
 from charts.common.style import apply_common_layout, color_for, color_sequence
 from charts.common.save import save_figures
+from charts.common.config import is_dev_mode
 
-import yaml
-project_root = Path(__file__).resolve().parents[2]
-config_path = project_root / "config.yaml"
-if config_path.exists():
-    with open(config_path) as f:
-        _CFG = yaml.safe_load(f)
-    dev_mode = _CFG.get("dev_mode", False)
-else:
-    dev_mode = False
+dev_mode = is_dev_mode()
 
 
 def generate_fig_wem_transport_measures(df: pd.DataFrame, output_dir: str) -> None:
@@ -35,7 +28,7 @@ def generate_fig_wem_transport_measures(df: pd.DataFrame, output_dir: str) -> No
 
     dfx = df[(df["Scenario"].isin(scenarios_list))&
             (df['Sector'] == "Transport")&
-            (df["Year"].isin(range(2024,2036)))][cols].copy() 
+            (df["Year"].between(2024, 2035))][cols].copy() 
 
     #RENAME
 
@@ -56,15 +49,18 @@ def generate_fig_wem_transport_measures(df: pd.DataFrame, output_dir: str) -> No
         'TraOther': "Other"
     }
     # --- Apply mapping to your dataframe ---
-    # This replaces any matching Scenario names with their friendly labels
-    dfx["Scenario"] = dfx["Scenario"].replace(scenario_map)
-    dfx["Subsector"] = dfx["Subsector"].replace(sector_map)
+    # Relabel on the categories (one lookup per unique name, not per row);
+    # categories are re-sorted so legend/axis order matches the friendly labels
+    for col, mapping in (("Scenario", scenario_map), ("Subsector", sector_map)):
+        dfx[col] = dfx[col].astype("category").cat.rename_categories(mapping)
+        dfx[col] = dfx[col].cat.reorder_categories(sorted(dfx[col].cat.categories))
+    dfx["Year"] = dfx["Year"].astype("int16")
 
     import pandas as pd
     import numpy as np
 
     data = (
-            dfx.groupby(["Subsector","Scenario","Year"])["CO2eq"]
+            dfx.groupby(["Subsector","Scenario","Year"], observed=True)["CO2eq"]
             .sum()
             .reset_index()
             )
@@ -89,7 +85,8 @@ def generate_fig_wem_transport_measures(df: pd.DataFrame, output_dir: str) -> No
     )
 
     # Clean up facet titles
-    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    for a in fig.layout.annotations:
+        a.text = a.text.split("=")[-1]
 
     # Layout tweaks
     fig.update_layout(
@@ -108,7 +105,6 @@ def generate_fig_wem_transport_measures(df: pd.DataFrame, output_dir: str) -> No
 
     print("saving generate_fig_line_emissions_ALL")
     save_figures(fig, output_dir, name="fig_wem_transport_measures")
-    data = dfx.copy()
 
     if not dev_mode:
         save_data_path = Path(output_dir) / "data.csv"
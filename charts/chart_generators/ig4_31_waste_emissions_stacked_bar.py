@@ -11,7 +11,6 @@ import sys, argparse
 from pathlib import Path
 import pandas as pd
 import plotly.express as px
-import yaml, shutil
 
 # ── project root on path ────────────────────────────────────────────
 project_root = Path(__file__).resolve().parents[2]
@@ -20,13 +19,11 @@ if str(project_root) not in sys.path:
 
 from charts.common.style import apply_common_layout, color_for
 from charts.common.save import save_figures
+from charts.common.config import get_config, is_dev_mode
 
 # ── config ─────────────────────────────────────────────────────────
-_CFG = {}
-cfg_path = project_root / "config.yaml"
-if cfg_path.exists():
-    _CFG = yaml.safe_load(cfg_path.read_text(encoding="utf-8")) or {}
-dev_mode = bool(_CFG.get("dev_mode", False))
+_CFG = get_config()
+dev_mode = is_dev_mode()
 
 # labels toggle (default OFF here)
 SHOW_LABELS = bool(_CFG.get("charts", {}).get("value_labels", True))
@@ -164,11 +161,6 @@ def generate_fig4_31_waste_emissions_stacked_bar(df: pd.DataFrame, output_dir: s
     out_df = agg.rename(columns={"Year_cat": "Year"})[["Year", "IPCC_L2", "MtCO2eq"]]
     out_df.to_csv(out_dir / f"{base}_data.csv", index=False)
 
-    # gallery copy (optional)
-    gal = project_root / "outputs" / "gallery"; gal.mkdir(parents=True, exist_ok=True)
-    p = out_dir / f"{base}_report.png"
-    if p.exists(): shutil.copy2(p, gal / p.name)
-
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
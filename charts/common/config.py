@@ -0,0 +1,82 @@
+# charts/common/config.py
+
+from __future__ import annotations
+import hashlib
+import json
+import os
+from pathlib import Path
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it; pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+ROOT = Path(__file__).resolve().parents[2]
+CONFIG_PATH = ROOT / "config.yaml"
+
+
+# path → (mtime_ns, size, parsed); callers treat the dict as read-only, so it is shared
+_YAML_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+# JSON copies of parsed YAML, reused across runs while the source is unchanged
+_JSON_DIR = ROOT / ".cache" / "yaml"
+
+
+def _sidecar(path: Path) -> Path:
+    digest = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+    return _JSON_DIR / f"{path.stem}-{digest}.json"
+
+
+def _read_sidecar(path: Path, stamp: list) -> dict | None:
+    try:
+        with open(_sidecar(path), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached["data"] if cached.get("stamp") == stamp else None
+
+
+def _write_sidecar(path: Path, stamp: list, cfg: dict) -> None:
+    # only when JSON holds the YAML exactly (no dates, non-string keys, ...)
+    try:
+        text = json.dumps({"stamp": stamp, "data": cfg})
+        if json.loads(text)["data"] != cfg:
+            return
+        _JSON_DIR.mkdir(parents=True, exist_ok=True)
+        _sidecar(path).write_text(text, encoding="utf-8")
+    except (TypeError, ValueError, OSError):
+        pass
+
+
+def load_yaml(path: Path) -> dict:
+    """
+    Parse a YAML file, re-reading only when its mtime or size changed; {} when missing.
+    Across runs the parse is reused from a JSON copy under .cache/yaml.
+    """
+    path = Path(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    hit = _YAML_CACHE.get(path)
+    if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+        return hit[2]
+    stamp = [st.st_mtime_ns, st.st_size]
+    cfg = _read_sidecar(path, stamp)
+    if cfg is None:
+        with open(path, "r", encoding="utf-8") as f:
+            cfg = yaml.load(f, Loader=_SafeLoader) or {}
+        _write_sidecar(path, stamp, cfg)
+    _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, cfg)
+    return cfg
+
+
+def get_config() -> dict:
+    """config.yaml, parsed once and re-parsed only after the file changes."""
+    return load_yaml(CONFIG_PATH)
+
+
+def is_dev_mode() -> bool:
+    return bool(get_config().get("dev_mode", False))
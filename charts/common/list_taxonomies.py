@@ -29,14 +29,26 @@ sys.path.insert(0, str(PROJECT_ROOT))
 print(f"🔎 Using PROJECT_ROOT = {PROJECT_ROOT}")
 print(f"📦 Looking for data at:\n  - {PARQ}\n  - {CSV}")
 
+# Only the taxonomy columns are needed (for listing and palette extension)
+TAXONOMY_COLS = [
+    "Scenario", "ScenarioFamily", "ScenarioGroup", "Scenario_Group",
+    "Sector", "Commodity_Name", "Commodity",
+]
+
 # --- Load dataset (Parquet preferred, else CSV) -------------------------------
+table = None  # Arrow table when loaded from Parquet; uniq() works on it directly
 if PARQ.exists():
     try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
         import pyarrow.parquet as pq
-        df = pq.read_table(PARQ).to_pandas()
+        present = pq.ParquetFile(PARQ).schema_arrow.names
+        table = pq.read_table(PARQ, columns=[c for c in TAXONOMY_COLS if c in present])
+        df = table.to_pandas()
         print(f"✅ Loaded Parquet: {PARQ}")
     except Exception as e:
         print(f"⚠️ pyarrow read failed ({e}); trying pandas.read_parquet...")
+        table = None
         df = pd.read_parquet(PARQ)
 elif CSV.exists():
     df = pd.read_csv(CSV)
@@ -53,21 +65,27 @@ from charts.common.style import extend_palettes_from_df, color_for
 # Populate palettes from the dataframe (keeps curated logic first)
 extend_palettes_from_df(df)
 
-def uniq(series):
-    if series is None:
+def uniq_arrow(tbl, col: str) -> list[str]:
+    trimmed = pc.utf8_trim_whitespace(pc.cast(tbl[col], pa.string()))
+    return sorted(pc.unique(trimmed).drop_null().to_pylist())
+
+def uniq(col):
+    if col is None or col not in df.columns:
         return []
-    return sorted({str(x).strip() for x in series.dropna().astype(str).tolist()})
+    if table is not None:
+        return uniq_arrow(table, col)
+    return sorted({str(x).strip() for x in df[col].dropna().astype(str).tolist()})
 
 # Detect column names present in your dataset
 fam_col   = "ScenarioFamily" if "ScenarioFamily" in df.columns else None
 group_col = "ScenarioGroup" if "ScenarioGroup" in df.columns else ("Scenario_Group" if "Scenario_Group" in df.columns else None)
 fuel_col  = "Commodity_Name" if "Commodity_Name" in df.columns else ("Commodity" if "Commodity" in df.columns else None)
 
-scenarios          = uniq(df["Scenario"]) if "Scenario" in df.columns else []
-scenario_families  = uniq(df[fam_col]) if fam_col else []
-scenario_groups    = uniq(df[group_col]) if group_col else []
-sectors            = uniq(df["Sector"]) if "Sector" in df.columns else []
-fuels              = uniq(df[fuel_col]) if fuel_col else []
+scenarios          = uniq("Scenario")
+scenario_families  = uniq(fam_col)
+scenario_groups    = uniq(group_col)
+sectors            = uniq("Sector")
+fuels              = uniq(fuel_col)
 
 # Color for groups: prefer dedicated group palette if present
 def color_for_group(name: str) -> str:
@@ -97,12 +115,15 @@ tbl_sectors.to_csv(OUT_DIR / "sectors.csv", index=False)
 tbl_fuels.to_csv(OUT_DIR / "fuels.csv", index=False)
 
 # YAML palette skeleton
+def as_palette(tbl: pd.DataFrame) -> dict:
+    return dict(zip(tbl["label"].tolist(), tbl["suggested_hex"].tolist()))
+
 palette_yaml = {
-    "scenarios":          {r.label: r.suggested_hex for _, r in tbl_scenarios.iterrows()},
-    "scenario_families":  {r.label: r.suggested_hex for _, r in tbl_families.iterrows()},
-    "scenario_groups":    {r.label: r.suggested_hex for _, r in tbl_groups.iterrows()},
-    "sectors":            {r.label: r.suggested_hex for _, r in tbl_sectors.iterrows()},
-    "fuels":              {r.label: r.suggested_hex for _, r in tbl_fuels.iterrows()},
+    "scenarios":          as_palette(tbl_scenarios),
+    "scenario_families":  as_palette(tbl_families),
+    "scenario_groups":    as_palette(tbl_groups),
+    "sectors":            as_palette(tbl_sectors),
+    "fuels":              as_palette(tbl_fuels),
 }
 with open(OUT_DIR / "palette_suggestions.yaml", "w", encoding="utf-8") as f:
     yaml.safe_dump(palette_yaml, f, sort_keys=True, allow_unicode=True)
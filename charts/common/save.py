@@ -1,23 +1,229 @@
 # charts/common/save.py
 
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 
 import plotly.graph_objects as go
 
+try:  # optional: rasterise the SVG locally instead of a second Kaleido round trip
+    import cairosvg
+except ImportError:
+    cairosvg = None
+
+from charts.common.config import ROOT, get_config, is_dev_mode
 from charts.common.style_last import apply_final_export_style
 
+_OUTPUT = get_config().get("output", {}) or {}
+_FORMATS = _OUTPUT.get("formats") or ["png"]
+_RESOLUTIONS = _OUTPUT.get("resolutions") or {}
+
+# Global switch: "full" (margin-to-margin) or "half" (two-up side-by-side)
+SIZE_MODE = "full"   # "full" or "half"
+DPI = 300            # used to compute the canvas in pixels (fonts are sized for it)
+DRAFT_DPI = 150      # PNG raster DPI in dev_mode unless output.dpi says otherwise
+PNG_SCALE = float(_OUTPUT.get("png_scale", 1.0))  # keep 1.0: size is already set via dpi->px in style_last
+
+# USE_LOCAL_RASTER=0 forces Kaleido for PNGs too (A/B against the cairosvg path)
+USE_LOCAL_RASTER = os.environ.get("USE_LOCAL_RASTER", "1").lower() not in ("0", "false", "no")
+
+# Content-addressed renders shared by every chart: identical figures skip Kaleido
+CACHE_DIR = ROOT / ".cache" / "renders"
+CACHE_MAX_BYTES = int(float(_OUTPUT.get("render_cache_mb", 512)) * 2**20)  # least recently used go first
+# Digest of what each output file was last rendered from, mirroring the output tree
+DIGEST_DIR = ROOT / ".cache" / "digests"
+
+# One persistent Kaleido (Chromium) per process: None = not tried yet
+_KALEIDO_LOCK = threading.Lock()
+_KALEIDO_READY = None
 
-def save_figures(fig: go.Figure, output_dir: str, name: str) -> None:
+
+@lru_cache(maxsize=None)
+def ensure_dir(path) -> Path:
+    """Create `path` (and parents) once per process and return it as a Path."""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _mirror(src: Path, dst: Path) -> None:
+    """
+    Put `src` at `dst` without duplicating bytes: hardlink, else symlink, else copy.
+    Linked gallery files share the original's data, so editing one edits both.
+    A `dst` that already is `src` (linked on an earlier save) is left alone.
     """
-    Save the figure as a standardised report-ready PNG.
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        try:
+            dst.symlink_to(src.resolve())
+        except OSError:
+            shutil.copy2(src, dst)
+
+
+def _start_kaleido() -> None:
+    """
+    Start Kaleido's sync server once per process so plotly's write_image reuses a
+    single browser instead of booting Chromium for every image.
+    MathJax is left out of the page since no chart uses LaTeX labels.
+    Falls back to per-call rendering on kaleido<1 or when Chrome is missing.
+    """
+    global _KALEIDO_READY
+    with _KALEIDO_LOCK:
+        if _KALEIDO_READY is not None:
+            return
+        _KALEIDO_READY = False
+        try:
+            import kaleido
+            # Constructing Kaleido fails fast without Chrome; the server thread would
+            # otherwise die silently and leave write_image waiting forever.
+            kaleido.Kaleido(mathjax=False)
+            kaleido.start_sync_server(mathjax=False, silence_warnings=True)  # stopped via atexit
+            _KALEIDO_READY = True
+        except Exception as e:
+            print(f"⚠ persistent Kaleido unavailable ({e}); rendering per call")
+
+
+def _digest_path(path: Path) -> Path:
+    """Sidecar for `path` under DIGEST_DIR, so the output folders hold only deliverables."""
+    path = path.resolve()
+    try:
+        rel = path.relative_to(ROOT)
+    except ValueError:  # output outside the project: key on the absolute path
+        rel = Path(hashlib.blake2b(str(path).encode(), digest_size=16).hexdigest())
+    return ensure_dir(DIGEST_DIR / rel.parent) / f"{rel.name}.sha"
+
+
+@lru_cache(maxsize=1)
+def _prune_cache() -> None:
+    """
+    Trim CACHE_DIR to CACHE_MAX_BYTES, oldest first, once per process before its first store.
+    Cache hits touch their entry, so mtime is the time of last use.
+    """
+    entries = []
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for e in it:
+                try:
+                    st = e.stat()
+                except FileNotFoundError:  # another worker pruned it first
+                    continue
+                entries.append((st.st_mtime, st.st_size, e.path))
+    except FileNotFoundError:
+        return
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry_path in entries:
+        if total <= CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(entry_path)
+        except FileNotFoundError:  # another worker pruned it first
+            pass
+        total -= size
+
+
+def _write(
+    fig: go.Figure,
+    fig_json: str,
+    path: Path,
+    fmt: str,
+    width: int,
+    height: int,
+    svg_path: Path = None,
+    scale: float = PNG_SCALE,
+) -> None:
+    """
+    Render one image, skipping Kaleido when the figure is unchanged since the last save.
+    For PNGs, passing an already-written `svg_path` rasterises it with cairosvg instead.
+    The renderer is part of the cache key, so USE_LOCAL_RASTER=0 never gets a cairosvg PNG.
+    """
+    sha_path = _digest_path(path)
+    renderer = "cairosvg" if svg_path is not None else "kaleido"
+    digest = hashlib.blake2b(
+        f"{fig_json}|{fmt}|{width}x{height}@{scale}|{renderer}".encode(), digest_size=16
+    ).hexdigest()
+    if path.exists() and sha_path.exists() and sha_path.read_text() == digest:
+        print(f"⏭ {path.name} unchanged — skipping render")
+        return
+    cached = CACHE_DIR / f"{digest}.{fmt}"
+    try:
+        shutil.copyfile(cached, path)
+        os.utime(cached)  # mark as recently used for _prune_cache
+    except FileNotFoundError:  # not cached (or pruned meanwhile): render below
+        pass
+    else:
+        sha_path.write_text(digest)
+        print(f"♻ {path.name} restored from render cache")
+        return
+
+    t0 = time.time()
+    print(f"💾 saving standardised {fmt.upper()} to {path.name} (w={width}, h={height})")
+    # Render to bytes and write in-process, so the cache entry is written from the same buffer.
+    if svg_path is not None:
+        data = cairosvg.svg2png(
+            url=str(svg_path),
+            output_width=round(width * scale),
+            output_height=round(height * scale),
+        )
+    else:
+        _start_kaleido()
+        data = fig.to_image(format=fmt, width=width, height=height, scale=scale)
+    path.write_bytes(data)
+    print(f"✅ {fmt.upper()} written in {time.time() - t0:.1f}s")
+    sha_path.write_text(digest)
+    _prune_cache()
+    (ensure_dir(CACHE_DIR) / cached.name).write_bytes(data)
+
+
+def _canonical_json(fig: go.Figure) -> str:
+    """Figure JSON with sorted keys and floats rounded to 6 d.p., so float noise doesn't miss the cache."""
+    data = json.loads(fig.to_json(), parse_float=lambda x: round(float(x), 6))
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def save_figures(
+    fig: go.Figure,
+    output_dir: str,
+    name: str,
+    *,
+    formats=None,
+    resolutions=None,
+    gallery: bool = True,
+    dpi: int = None,
+) -> None:
+    """
+    Save the figure as standardised report-ready images.
 
     Standardisation happens in charts/common/style_last.py, applied as the final step
     so generator modules don't need per-figure tweaks.
+
+    Each (format, resolution) pair is rendered exactly once:
+    - formats default to `output.formats` in config.yaml (png if unset)
+    - resolutions default to "report", the Word-fit canvas from style_last; any other
+      name is looked up in `output.resolutions` and saved as `<name>_<resolution>.<fmt>`
+    When both png and svg are requested and cairosvg is installed, only the SVG goes
+    through Kaleido and the PNG is rasterised from it (USE_LOCAL_RASTER=0 disables this).
+    PNGs are rendered at `output.png_scale` (default 1.0), further scaled to `dpi`:
+    the layout is always built for the 300-dpi canvas, so a lower DPI shrinks the raster
+    without changing proportions. `dpi` defaults to `output.dpi`, else 150 in dev_mode
+    (use that for drafts) and 300 for final output.
+    With gallery=True the report PNG (the SVG when png isn't emitted) is linked into
+    outputs/gallery. This is the only step that fills the gallery; generators and
+    generate_charts.py don't copy into it.
     """
-    # Global switch: "full" (margin-to-margin) or "half" (two-up side-by-side)
-    SIZE_MODE = "full"   # "full" or "half"
-    DPI = 300            # used to compute the canvas in pixels
-    PNG_SCALE = 1.0      # keep 1.0 if size is already set via dpi->px in style_last
+    formats = list(formats or _FORMATS)
+    resolutions = list(resolutions or ["report"])
+    dpi = dpi or _OUTPUT.get("dpi") or (DRAFT_DPI if is_dev_mode() else DPI)
+    png_scale = PNG_SCALE * dpi / DPI
 
     # Apply final export styling (2:1 aspect, Word A4 Moderate fit, standard fonts)
     fig, width, height = apply_final_export_style(
@@ -26,23 +232,31 @@ def save_figures(fig: go.Figure, output_dir: str, name: str) -> None:
         dpi=DPI,
     )
 
-    output_dir = Path(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    png_path = output_dir / f"{name}_report.png"
-    print(f"💾 saving standardised PNG to {png_path.name}")
-    fig.write_image(
-        str(png_path),
-        format="png",
-        width=width,
-        height=height,
-        scale=PNG_SCALE,
+    output_dir = ensure_dir(output_dir)
+    fig_json = _canonical_json(fig)
+    local_raster = (
+        USE_LOCAL_RASTER and cairosvg is not None and {"png", "svg"} <= set(formats)
     )
+    if local_raster:
+        # SVG first so the PNG can be rasterised from it
+        formats.sort(key=lambda f: f != "svg")
 
-    import time
-
-    t0 = time.time()
-    print(f"💾 saving standardised PNG to {png_path.name} (w={width}, h={height})")
-    fig.write_image(str(png_path), format="png", width=width, height=height, scale=PNG_SCALE)
-    print(f"✅ PNG written in {time.time() - t0:.1f}s")
+    for res in resolutions:
+        if res == "report":
+            w, h = width, height
+        elif res in _RESOLUTIONS:
+            w, h = _RESOLUTIONS[res]["width"], _RESOLUTIONS[res]["height"]
+        else:
+            print(f"⚠ unknown resolution '{res}' — skipping")
+            continue
+        for fmt in formats:
+            svg_path = output_dir / f"{name}_{res}.svg" if local_raster and fmt == "png" else None
+            scale = png_scale if fmt == "png" else PNG_SCALE
+            _write(fig, fig_json, output_dir / f"{name}_{res}.{fmt}", fmt, w, h, svg_path, scale)
 
+    gallery_fmt = next((f for f in ("png", "svg") if f in formats), None)
+    if gallery and gallery_fmt and "report" in resolutions:
+        src = output_dir / f"{name}_report.{gallery_fmt}"
+        gallery_dir = ensure_dir(ROOT / "outputs" / "gallery")
+        _mirror(src, gallery_dir / src.name)
+        print(f"🖼️  linked into gallery: {gallery_dir / src.name}")
@@ -1,20 +1,22 @@
 # charts/common/style.py
 
 from __future__ import annotations
-from pathlib import Path
-from typing import Iterable, Optional
-import yaml
-import plotly.graph_objects as go
-
-# ───────────────────────── Project config (optional) ──────────────────────────
-ROOT = Path(__file__).resolve().parents[2]
-_CFG_PATH = ROOT / "config.yaml"
-if _CFG_PATH.exists():
-    with open(_CFG_PATH, "r", encoding="utf-8") as f:
-        _CFG = yaml.safe_load(f)
-    _PROJ = _CFG.get("project", {})
-else:
-    _PROJ = {}
+import re
+import zlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+def __getattr__(name: str):
+    # Plotly is imported on first use, so palette-only imports stay light
+    if name == "go":
+        import plotly.graph_objects as _go
+        globals()["go"] = _go
+        return _go
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ─────────────────────────────────── Fonts ────────────────────────────────────
 FONT_FAMILY = "Aptos, Arial, Segoe UI, Calibri, Helvetica, sans-serif"
@@ -139,6 +141,9 @@ SECTOR_ALIASES = {
 SCENARIO_TO_GROUP: dict[str, str] = {}
 SCENARIO_TO_FAMILY: dict[str, str] = {}
 
+# (kind, raw name) → resolved colour; reset whenever the palettes are re-extended
+_RESOLVED: dict[tuple[str, str], str] = {}
+
 # ───────────────────────────── Color utilities ────────────────────────────────
 def _hex_to_rgb(h: str) -> tuple[int, int, int]:
     h = h.lstrip("#")
@@ -147,68 +152,106 @@ def _hex_to_rgb(h: str) -> tuple[int, int, int]:
 def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
     return "#{:02X}{:02X}{:02X}".format(*rgb)
 
+@lru_cache(maxsize=None)
 def _adjust_brightness(hex_color: str, factor: float) -> str:
-    r, g, b = _hex_to_rgb(hex_color)
-    r = min(255, int(r * factor))
-    g = min(255, int(g * factor))
-    b = min(255, int(b * factor))
-    return _rgb_to_hex((r, g, b))
+    # one parse into a packed 0xRRGGBB int; channels come out via shifts
+    v = int(hex_color.lstrip("#"), 16)
+    r = min(255, int((v >> 16) * factor))
+    g = min(255, int(((v >> 8) & 0xFF) * factor))
+    b = min(255, int((v & 0xFF) * factor))
+    return f"#{r << 16 | g << 8 | b:06X}"
+
+# Colours already taken in each module palette, kept in step by _assign_from_cycle
+_USED: dict[int, set[str]] = {
+    id(d): set(d.values())
+    for d in (FUEL_COLORS, SECTOR_COLORS, SCENARIO_GROUP_COLORS, SCENARIO_FAMILY_COLORS)
+}
 
 def _assign_from_cycle(existing: dict, key: str) -> str:
-    used = set(existing.values())
+    used = _USED.get(id(existing))
+    if used is None:  # not one of the module palettes
+        used = set(existing.values())
     for c in FALLBACK_CYCLE:
         if c not in used:
             existing[key] = c
+            used.add(c)
             return c
-    existing[key] = DEFAULT_COLOR
-    return DEFAULT_COLOR
+    # Cycle exhausted: wrap around by a stable hash of the label, so the colour
+    # doesn't depend on which other labels came first
+    c = FALLBACK_CYCLE[zlib.crc32(key.encode("utf-8")) % len(FALLBACK_CYCLE)]
+    existing[key] = c
+    return c
 
 def _norm(s: Optional[str]) -> str:
     return (s or "").strip()
 
+@lru_cache(maxsize=None)
+def _norm_sector(label: str) -> str:
+    return SECTOR_ALIASES.get(label.upper(), label)
+
+_COMPACT = str.maketrans("", "", " -")  # drop spaces and hyphens in one pass
+
+@lru_cache(maxsize=None)
 def _norm_fuel(label: str) -> str:
     s = _norm(label)
     if not s:
         return s
     key = s.upper()
-    if key in FUEL_ALIASES:
-        return FUEL_ALIASES[key]
-    compact = key.replace(" ", "").replace("-", "")
-    if compact in FUEL_ALIASES:
-        return FUEL_ALIASES[compact]
+    v = FUEL_ALIASES.get(key)
+    if v is not None:
+        return v
+    compact = key.translate(_COMPACT)
+    v = FUEL_ALIASES.get(compact)
+    if v is not None:
+        return v
     if compact.startswith("E"):
         base = compact[1:]
         return FUEL_ALIASES.get(base, base.title() if base else s)
     return s
 
+# One regex scan per name; every token found is ranked, so precedence (earlier in the
+# rank list wins) doesn't depend on where in the name the token appears.
+_GROWTH_RE = re.compile(r"-(LG|RG|HG)|(LG|RG|HG)\Z")
+_GROWTH_RANK = ("LG", "RG", "HG")
+
+_GROUP_RE = re.compile(r"CPP|HIGH CARBON|LOW CARBON|NET ?ZERO|NZ|BASE")
+_GROUP_OF = {
+    "CPP": "CPP", "HIGH CARBON": "High Carbon", "LOW CARBON": "Low Carbon",
+    "NET ZERO": "Low Carbon", "NETZERO": "Low Carbon", "NZ": "Low Carbon", "BASE": "BASE",
+}
+_GROUP_RANK = ("CPP", "High Carbon", "Low Carbon", "BASE")
+
+_FAMILY_RE = re.compile(r"CPP[1-4]|HIGH CARBON|LOW CARBON|BASE")
+_FAMILY_OF = {
+    "CPP1": "CPP1", "CPP2": "CPP2", "CPP3": "CPP3", "CPP4": "CPP4 Variant",
+    "HIGH CARBON": "High Carbon", "LOW CARBON": "Low Carbon", "BASE": "BASE",
+}
+_FAMILY_RANK = ("CPP1", "CPP2", "CPP3", "CPP4 Variant", "High Carbon", "Low Carbon", "BASE")
+
+@lru_cache(maxsize=None)
 def _growth_code(s: str) -> Optional[str]:
-    su = s.upper()
-    for code in ("LG", "RG", "HG"):
-        if f"-{code}" in su or su.endswith(code):
-            return code
-    return None
+    found = {m.group(1) or m.group(2) for m in _GROWTH_RE.finditer(s.upper())}
+    return next((c for c in _GROWTH_RANK if c in found), None)
 
+@lru_cache(maxsize=None)
 def _group_from_name(s: str) -> str:
-    su = s.upper()
-    if "CPP" in su: return "CPP"
-    if "HIGH CARBON" in su: return "High Carbon"
-    if "LOW CARBON" in su or "NET ZERO" in su or "NETZERO" in su or "NZ" in su: return "Low Carbon"
-    if "BASE" in su: return "BASE"
-    return "BASE"
+    found = {_GROUP_OF[t] for t in _GROUP_RE.findall(s.upper())}
+    return next((g for g in _GROUP_RANK if g in found), "BASE")
 
+@lru_cache(maxsize=None)
 def _family_from_name(s: str) -> str:
-    su = s.upper()
-    if "CPP1" in su: return "CPP1"
-    if "CPP2" in su: return "CPP2"
-    if "CPP3" in su: return "CPP3"
-    if "CPP4" in su: return "CPP4 Variant"
-    if "HIGH CARBON" in su: return "High Carbon"
-    if "LOW CARBON" in su: return "Low Carbon"
-    if "BASE" in su: return "BASE"
-    return "BASE"
+    found = {_FAMILY_OF[t] for t in _FAMILY_RE.findall(s.upper())}
+    return next((f for f in _FAMILY_RANK if f in found), "BASE")
 
 # ───────────────────────────── Public color API ───────────────────────────────
 def color_for(kind: str, name: str) -> str:
+    key = (kind, name)
+    col = _RESOLVED.get(key)
+    if col is None:
+        col = _RESOLVED[key] = _slow_color_for(kind, name)
+    return col
+
+def _slow_color_for(kind: str, name: str) -> str:
     name = _norm(name)
     if not name:
         return DEFAULT_COLOR
@@ -220,7 +263,7 @@ def color_for(kind: str, name: str) -> str:
         return FUEL_COLORS[label]
 
     if kind == "sector":
-        label = SECTOR_ALIASES.get(name.upper(), name)
+        label = _norm_sector(name)
         if label not in SECTOR_COLORS:
             return _assign_from_cycle(SECTOR_COLORS, label)
         return SECTOR_COLORS[label]
@@ -250,59 +293,69 @@ def color_for(kind: str, name: str) -> str:
     return DEFAULT_COLOR
 
 def color_sequence(kind: str, names: Iterable[str]) -> list[str]:
-    return [color_for(kind, n) for n in names]
+    get = _RESOLVED.get
+    return [get((kind, n)) or color_for(kind, n) for n in names]
 
 # ──────────────── Data-driven palette extension from dataframe ────────────────
+def _uniques(col) -> list[str]:
+    """Distinct non-null labels of a column as strings, deduplicated before str conversion."""
+    return [str(x) for x in col.dropna().unique()]
+
+def _first_pairs(df, a: str, b: str):
+    """(a, b) string pairs in first-occurrence order, one per distinct row."""
+    pairs = df[[a, b]].dropna().drop_duplicates()
+    return zip(pairs[a].astype(str), pairs[b].astype(str))
+
 def extend_palettes_from_df(df) -> None:
+    _RESOLVED.clear()  # scenario→group mappings below can change scenario colours
     for col in ("Commodity_Name", "Commodity"):
         if col in df.columns:
-            names = sorted({_norm_fuel(x) for x in df[col].dropna().astype(str).unique()})
+            names = sorted({_norm_fuel(x) for x in _uniques(df[col])})
             for n in names:
                 _ = color_for("fuel", n)
             break
 
     if "Sector" in df.columns:
-        names = sorted({SECTOR_ALIASES.get(str(x).upper(), str(x))
-                        for x in df["Sector"].dropna().astype(str).unique()})
+        names = sorted({_norm_sector(x) for x in _uniques(df["Sector"])})
         for n in names:
             _ = color_for("sector", n)
 
     fam_col = "ScenarioFamily" if "ScenarioFamily" in df.columns else None
     if fam_col:
-        fams = sorted({str(x) for x in df[fam_col].dropna().astype(str).unique()})
+        fams = sorted(set(_uniques(df[fam_col])))
         for n in fams:
             _ = color_for("scenario_family", n)
         if "Scenario" in df.columns:
-            for scen, fam in df[["Scenario", fam_col]].dropna().astype(str).values:
+            for scen, fam in _first_pairs(df, "Scenario", fam_col):
                 SCENARIO_TO_FAMILY.setdefault(scen, fam)
 
     grp_col = "ScenarioGroup" if "ScenarioGroup" in df.columns else ("Scenario_Group" if "Scenario_Group" in df.columns else None)
     if grp_col:
-        grps = sorted({str(x) for x in df[grp_col].dropna().astype(str).unique()})
+        grps = sorted(set(_uniques(df[grp_col])))
         for n in grps:
             if n not in SCENARIO_GROUP_COLORS:
                 _assign_from_cycle(SCENARIO_GROUP_COLORS, n)
         if "Scenario" in df.columns:
-            for scen, grp in df[["Scenario", grp_col]].dropna().astype(str).values:
+            for scen, grp in _first_pairs(df, "Scenario", grp_col):
                 SCENARIO_TO_GROUP.setdefault(scen, grp)
 
     if "Scenario" in df.columns:
-        for n in sorted({str(x) for x in df["Scenario"].dropna().astype(str).unique()}):
+        for n in sorted(set(_uniques(df["Scenario"]))):
             _ = color_for("scenario", n)
 
 # ───────────────────────────── Common Plotly layout ───────────────────────────
-def apply_common_layout(fig: go.Figure, image_type: str = "report") -> go.Figure:
-    scale_map = {"dev": 1.0, "report": 2.0}
-    scale = scale_map.get(image_type, 1.0)
+_SCALE_MAP = {"dev": 1.0, "report": 2.0}
 
+@lru_cache(maxsize=None)
+def _layout_spec(scale: float) -> tuple[dict, dict, dict]:
+    """(layout, xaxes, yaxes) kwargs for one scale; built once and shared by every figure."""
     base_font   = 13 * scale
     title_font  = 18 * scale
     legend_font = 12 * scale
     tick_font   = int(base_font * 0.8)
     axis_title_font = int(title_font * 0.8)
 
-    fig.update_layout(
-        template="simple_white",
+    layout = dict(
         #height=int(600 * scale),
         font=dict(family=FONT_FAMILY, size=base_font, color="black"),
         margin=dict(l=110, r=80, t=60, b=int(100 * scale)),
@@ -314,7 +367,7 @@ def apply_common_layout(fig: go.Figure, image_type: str = "report") -> go.Figure
                     font=dict(size=legend_font, family=FONT_FAMILY)),
     )
 
-    fig.update_xaxes(
+    xaxes = dict(
         showgrid=True, gridwidth=0.6, gridcolor="lightgrey",
         tickangle=0, ticks="outside", ticklen=5,
         tickfont=dict(size=tick_font, family=FONT_FAMILY),
@@ -325,7 +378,7 @@ def apply_common_layout(fig: go.Figure, image_type: str = "report") -> go.Figure
                    ticklen=3, tick0=0, dtick=1)
     )
 
-    fig.update_yaxes(
+    yaxes = dict(
         showgrid=True, gridwidth=0.6, gridcolor="lightgrey",
         title_standoff=28,   # try 28–40
         ticks="outside", ticklen=5,
@@ -336,10 +389,21 @@ def apply_common_layout(fig: go.Figure, image_type: str = "report") -> go.Figure
         minor=dict(ticks="outside", showgrid=True, gridcolor="whitesmoke",
                    ticklen=3, tick0=0, dtick=25000)
     )
+    return layout, xaxes, yaxes
 
-    return fig
+def apply_common_layout(fig: go.Figure, image_type: str = "report") -> go.Figure:
+    scale = _SCALE_MAP.get(image_type, 1.0)
+    # Already styled at this scale: a second pass would only re-run plotly's validators
+    if getattr(fig, "_satimge_styled", None) == scale:
+        return fig
+    layout, xaxes, yaxes = _layout_spec(scale)
 
-import plotly.graph_objects as go
+    fig.update_layout(template="simple_white", **layout)
+    fig.update_xaxes(**xaxes)
+    fig.update_yaxes(**yaxes)
+
+    fig._satimge_styled = scale
+    return fig
 
 def _first_color(val):
     """Return a single color string from a value that might be a scalar, list, or None."""
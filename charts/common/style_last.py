@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Optional
 import plotly.graph_objects as go
 
@@ -31,6 +32,7 @@ class WordA4ModerateSpec:
     def content_w_in(self) -> float:
         return self.page_w_in - (self.margin_l_in + self.margin_r_in)
 
+    @lru_cache(maxsize=8)  # pure in (spec, mode, dpi); frozen dataclass is hashable
     def canvas_px(self, mode: SizeMode, dpi: int = DPI) -> tuple[int, int]:
         if mode == "full":
             w_in = self.content_w_in
@@ -43,6 +45,9 @@ class WordA4ModerateSpec:
         return int(round(w_in * dpi)), int(round(h_in * dpi))
 
 
+_SPEC = WordA4ModerateSpec()
+
+
 def apply_final_export_style(
     fig: go.Figure,
     *,
@@ -57,8 +62,7 @@ def apply_final_export_style(
     - Keep legends readable and inside safe margins
     Returns (fig, width_px, height_px)
     """
-    spec = WordA4ModerateSpec()
-    width_px, height_px = spec.canvas_px(size_mode, dpi=dpi)
+    width_px, height_px = _SPEC.canvas_px(size_mode, dpi=dpi)
 
     # Font sizes tuned for this canvas; adjust once here, globally.
     # (These are "final truth" sizes; your earlier layout helper can still do general styling.)
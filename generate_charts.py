@@ -1,63 +1,97 @@
 # generate_charts.py
 
 import sys
+import os
 from pathlib import Path
 import argparse
-import pkgutil
+import ast
 import importlib
 import inspect
-import shutil
-import pandas as pd
-import yaml
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 
 # 1) Paths
-print('setting up paths')
 PROJECT_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(PROJECT_ROOT))
+
+from charts.common.config import load_yaml
 CONFIG_PATH  = PROJECT_ROOT / "config.yaml"
 CHARTS_DIR   = PROJECT_ROOT / "charts" / "chart_generators"
 DATA_PATH    = PROJECT_ROOT / "data" / "processed" / "processed_dataset.parquet"
+DATA_CSV     = DATA_PATH.with_suffix(".csv")
 OUT_BASE     = PROJECT_ROOT / "outputs" / "charts_and_data"
 GALLERY_BASE = PROJECT_ROOT / "outputs" / "gallery"
+DISPATCH_CACHE = PROJECT_ROOT / ".cache" / "chart_dispatch.json"
 
-# 2) CLI (config only)
-parser = argparse.ArgumentParser(description="Generate all SATIMGE charts")
-parser.add_argument("--config", "-c", type=Path, default=CONFIG_PATH, help="Path to config.yaml")
-args = parser.parse_args()
-
-# 3) Load config (charts only from config)
-print('load config file')
-with open(args.config, "r", encoding="utf-8") as fh:
-    tools_cfg = yaml.safe_load(fh)
-charts_to_run = set(tools_cfg["charts"]["include"])
-DEV_MODE = tools_cfg.get("dev_mode", False)  # still read, in case generators use it
-
-# 4) Prepare folders
-print('prepare output folders')
-for d in (OUT_BASE, GALLERY_BASE):
-    d.mkdir(parents=True, exist_ok=True)
-
-# 5) Load full dataset once
-print('load processed dataset')
-try:
-    import pyarrow.parquet as pq
-    df = pq.read_table(DATA_PATH).to_pandas()
-except Exception:
-    df = pd.read_parquet(DATA_PATH)
-print('done loading dataset')
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Dataset used by _run_chart; set in the parent (serial) or per worker (pool)
+_DF = None
+# Worker's view of the parent's shared Arrow stream; numeric columns of _DF point into it
+_SHM = None
+# Palettes are extended from _DF on the first chart that actually runs
+_PALETTES_READY = False
+
+# Always loaded when present: extend_palettes_from_df assigns colours from them, and
+# colours must not depend on which charts happen to run
+PALETTE_COLUMNS = ("Commodity_Name", "Commodity", "Sector", "Scenario",
+                   "ScenarioFamily", "ScenarioGroup", "Scenario_Group")
+
+
+def _required_columns(module_names):
+    """
+    Union of the module-level REQUIRED_COLUMNS tuples of the given chart modules.
+    Read from the source with ast, so nothing is imported; None (load every column)
+    when any module doesn't declare one.
+    """
+    needed = set()
+    for name in module_names:
+        try:
+            tree = ast.parse((CHARTS_DIR / f"{name}.py").read_text(encoding="utf-8"))
+        except (OSError, SyntaxError):
+            return None
+        for node in tree.body:
+            if isinstance(node, ast.Assign):
+                targets = node.targets
+            elif isinstance(node, ast.AnnAssign) and node.value is not None:
+                targets = [node.target]
+            else:
+                continue
+            if any(isinstance(t, ast.Name) and t.id == "REQUIRED_COLUMNS" for t in targets):
+                needed.update(ast.literal_eval(node.value))
+                break
+        else:
+            return None
+    return needed
 
-# 6) Import style and extend palettes
-print('importing sytles and palettes')
-from charts.common.style import extend_palettes_from_df
-extend_palettes_from_df(df)
 
-# 7) Auto-discover modules under charts/chart_generators
-print('discovering available chart modules')
-import charts.chart_generators as cg_pkg
-available = {name for _, name, _ in pkgutil.iter_modules(cg_pkg.__path__)}
-missing = charts_to_run - available
-if missing:
-    print(f"⚠ Listed in config but not found: {sorted(missing)}")
+def _load_table(columns=None):
+    """
+    The processed dataset as an Arrow table, limited to `columns` (plus PALETTE_COLUMNS)
+    when given.
+    Uses the parquet unless the CSV is newer (edited or regenerated without it); then the
+    CSV is parsed with Arrow's multi-threaded reader for this run. The parquet is left
+    alone: only generate_dataset.py writes it, with the dataset's schema and options.
+    """
+    import pyarrow.parquet as pq
+    if DATA_PATH.exists() and (not DATA_CSV.exists()
+                               or DATA_PATH.stat().st_mtime >= DATA_CSV.stat().st_mtime):
+        if columns is not None:
+            # only read what the selected charts use; names not in the file are ignored
+            wanted = set(columns) | set(PALETTE_COLUMNS)
+            columns = [c for c in pq.read_schema(DATA_PATH).names if c in wanted]
+        # mmap the local file: column buffers are paged in, not copied
+        return pq.read_table(DATA_PATH, columns=columns, memory_map=True, pre_buffer=True)
+
+    import pyarrow.csv as pacsv
+    print(f'{DATA_PATH.name} missing or older than {DATA_CSV.name}: reading CSV '
+          f'(re-run generate_dataset.py to refresh the parquet)')
+    table = pacsv.read_csv(DATA_CSV)
+    if columns is not None:
+        wanted = set(columns) | set(PALETTE_COLUMNS)
+        table = table.select([c for c in table.column_names if c in wanted])
+    return table
 
 
 def _pick_generator(module, module_name: str):
@@ -121,19 +155,120 @@ def _pick_generator(module, module_name: str):
     names = [n for n, _ in ranked[:4]]
     return None, f"ambiguous generators {names}; expected {exact}()"
 
-# 8) Run selected modules
-print('running selected chart modules')
-for module_name in sorted(charts_to_run & available):
+
+def _discover_modules() -> dict:
+    """
+    Chart modules in CHARTS_DIR: module name → st_mtime_ns of its source file.
+    One os.scandir pass (stat results are cached by the directory listing on Windows);
+    nothing is imported.
+    """
+    with os.scandir(CHARTS_DIR) as it:
+        return {e.name[:-3]: e.stat().st_mtime_ns for e in it
+                if e.name.endswith(".py") and not e.name.startswith("_")
+                and e.is_file(follow_symlinks=False)}
+
+
+def _load_dispatch(mtimes: dict) -> dict:
+    """
+    Generator names picked on earlier runs, for modules whose source is unchanged since.
+    DISPATCH_CACHE maps module name → [mtime_ns, function name].
+    """
+    try:
+        cached = json.loads(DISPATCH_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {name: fn for name, (mtime, fn) in cached.items() if mtimes.get(name) == mtime}
+
+
+def _save_dispatch(mtimes: dict, picked: dict) -> None:
+    """Merge this run's picks into DISPATCH_CACHE (best effort)."""
+    try:
+        cached = json.loads(DISPATCH_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cached = {}
+    cached.update({name: [mtimes[name], fn] for name, fn in picked.items()
+                   if fn and name in mtimes})
+    try:
+        DISPATCH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        DISPATCH_CACHE.write_text(json.dumps(cached, indent=1, sort_keys=True), encoding="utf-8")
+    except OSError as e:
+        print(f"⚠ could not write {DISPATCH_CACHE.name}: {e}")
+
+
+def _init_worker(table) -> None:
+    """
+    Process-pool initializer: build the DataFrame once per worker.
+    Numeric columns are copied out of the (memory-mapped or shared) table, so
+    generators may assign into _DF as they could with a plain read_parquet.
+    float32 measures (SATIMGE, CO2eq) are widened to float64 on the way, so chart
+    sums accumulate in float64.
+    """
+    import pyarrow as pa
+    global _DF
+    fields = [f.with_type(pa.float64()) if pa.types.is_float32(f.type) else f
+              for f in table.schema]
+    if fields != list(table.schema):
+        table = table.cast(pa.schema(fields, metadata=table.schema.metadata))
+    _DF = table.to_pandas()
+
+
+def _ensure_palettes() -> None:
+    """Import the style module and extend its palettes from _DF, once per process."""
+    global _PALETTES_READY
+    if not _PALETTES_READY:
+        from charts.common.style import extend_palettes_from_df
+        extend_palettes_from_df(_DF)
+        _PALETTES_READY = True
+
+
+def _share_table(table):
+    """
+    Write `table` once as an Arrow IPC stream into a new shared-memory block.
+    Returns (block, stream size); the caller closes and unlinks the block.
+    """
+    import pyarrow as pa
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock, table.schema) as writer:
+        writer.write_table(table)
+    size = mock.size()
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf))
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    sink.close()
+    return shm, size
+
+
+def _init_shared_worker(shm_name: str, size: int) -> None:
+    """Process-pool initializer: map the parent's Arrow stream (no pickling) and build _DF from it."""
+    import pyarrow as pa
+    global _SHM
+    _SHM = shared_memory.SharedMemory(name=shm_name)  # kept open for the worker's lifetime
+    table = pa.ipc.open_stream(pa.py_buffer(_SHM.buf)[:size]).read_all()
+    _init_worker(table)
+
+
+def _run_chart(module_name: str, fn_name: str = None):
+    """
+    Import one chart module and run its generator; save_figures links each report
+    image into the gallery.
+    `fn_name` is a generator picked on an earlier run (see DISPATCH_CACHE); without it,
+    or when it no longer exists, _pick_generator chooses. Returns the generator's name.
+    """
     try:
         module = importlib.import_module(f"charts.chart_generators.{module_name}")
     except Exception as e:
         print(f"❌ Failed to import {module_name}: {e}")
-        continue
+        return None
 
-    fn, picked_info = _pick_generator(module, module_name)
+    fn = getattr(module, fn_name, None) if fn_name else None
+    if callable(fn):
+        picked_info = f"{fn_name} (cached)"
+    else:
+        fn, picked_info = _pick_generator(module, module_name)
     if fn is None:
         print(f"⚠ Skipping {module_name}: {picked_info}")
-        continue
+        return None
 
     print(f"⏳ Running {fn.__name__} for {module_name} [{picked_info}]…")
 
@@ -143,17 +278,85 @@ for module_name in sorted(charts_to_run & available):
 
     # module saves figures/data into chart_dir
     try:
-        fn(df, str(chart_dir))
+        _ensure_palettes()
+        fn(_DF, str(chart_dir))
     except Exception as e:
         print(f"❌ {module_name}: generator threw an error: {e}")
-        continue
-
-    # copy only high-res “report” PNGs to gallery (flat structure)
-    try:
-        for f in chart_dir.iterdir():
-            if f.name.endswith("_report.png"):
-                shutil.copy(f, GALLERY_BASE / f.name)
-    except Exception as e:
-        print(f"⚠ {module_name}: failed copying report PNGs to gallery: {e}")
+        return fn.__name__
 
     print(f"✔ {module_name} done.")
+    return fn.__name__
+
+
+def main() -> None:
+    # 2) CLI (config only)
+    parser = argparse.ArgumentParser(description="Generate all SATIMGE charts")
+    parser.add_argument("--config", "-c", type=Path, default=CONFIG_PATH, help="Path to config.yaml")
+    parser.add_argument("--workers", "-j", type=int, default=DEFAULT_WORKERS,
+                        help="Chart modules rendered in parallel (1 = serial)")
+    args = parser.parse_args()
+
+    # 3) Load config (charts only from config)
+    print('load config file')
+    if not args.config.exists():
+        parser.error(f"config file not found: {args.config}")
+    tools_cfg = load_yaml(args.config)
+    charts_to_run = set(tools_cfg["charts"]["include"])
+
+    # 4) Prepare folders
+    print('prepare output folders')
+    for d in (OUT_BASE, GALLERY_BASE):
+        d.mkdir(parents=True, exist_ok=True)
+
+    # 5) Auto-discover modules under charts/chart_generators
+    print('discovering available chart modules')
+    available = _discover_modules()
+    missing = charts_to_run - available.keys()
+    if missing:
+        print(f"⚠ Listed in config but not found: {sorted(missing)}")
+    selected = sorted(charts_to_run & available.keys())
+    if not selected:
+        print('no chart modules selected — nothing to do')
+        return
+
+    # 6) Load the dataset once — only the columns the selected modules declare
+    print('load processed dataset')
+    columns = _required_columns(selected)
+    table = _load_table(columns)
+    print(f'done loading dataset ({table.num_columns} columns)')
+
+    # 7) Run selected modules — each worker builds its DataFrame once via the initializer
+    print('running selected chart modules')
+    mtimes = {name: available[name] for name in selected}
+    dispatch = _load_dispatch(mtimes)
+    picked = {}
+    workers = max(1, min(args.workers, len(selected) or 1))
+    if workers == 1:
+        _init_worker(table)
+        for module_name in selected:
+            picked[module_name] = _run_chart(module_name, dispatch.get(module_name))
+    else:
+        print(f'using {workers} worker processes')
+        # Workers read the table from one shared Arrow stream instead of each
+        # receiving a pickled copy
+        shm, size = _share_table(table)
+        del table
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_shared_worker,
+                                     initargs=(shm.name, size)) as ex:
+                futures = {ex.submit(_run_chart, m, dispatch.get(m)): m for m in selected}
+                for fut in as_completed(futures):
+                    try:
+                        picked[futures[fut]] = fut.result()
+                    except Exception as e:
+                        print(f"❌ {futures[fut]}: worker failed: {e}")
+        finally:
+            shm.close()
+            shm.unlink()
+    picked = {name: fn for name, fn in picked.items() if fn}
+    if picked != dispatch:
+        _save_dispatch(mtimes, picked)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,19 @@
 # %%
 # generate_dataset.py
 
+import json
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from charts.common.config import get_config
 from utils.mappings import (
-    map_scenario_family,
-    map_sector_group,
-    extract_carbon_budget,
-    map_economic_growth,
+    map_sector_group_vec,
+    add_scenario_metadata,
     apply_mapping_and_clean,
 )
 
@@ -19,14 +25,80 @@ OUT_PARQUET = "data/processed/processed_dataset.parquet"
 
 # Pick the Sets & Maps workbook you actually have locally
 path_setsandmaps = r"C:\Models\SATIMGE_Veda\SetsAndMaps\SetsAndMaps.xlsm"
+# Parsed copies of its sheets, reused while the workbook is unchanged
+MAPS_CACHE_DIR = Path("data/processed")
 # ─────────────────────────────────────────────────────────────────────────────
 
+
+_MAPS_STAMP_KEY = b"setsandmaps_source"
+
+
+def _maps_cache_stamp(cache):
+    """The source stamp stored in a sheet cache's parquet metadata, or None."""
+    try:
+        meta = pq.read_schema(cache).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    return meta.get(_MAPS_STAMP_KEY)
+
+
+def read_setsandmaps(path, sheets=("mapPRC", "mapCOM")):
+    """
+    The Sets & Maps sheets as DataFrames, parsed from the workbook once and then
+    served from `_setsandmaps_<sheet>.parquet`. Each cache records the workbook's
+    path, size and mtime, and is used only while all three still match.
+    Mixed int/str columns are stored as strings (the dataset ends up with them as
+    strings anyway), in both the fresh and the cached path so they agree.
+    """
+    st = Path(path).stat()
+    stamp = json.dumps(
+        {"path": str(Path(path).resolve()), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    ).encode()
+    caches = {sh: MAPS_CACHE_DIR / f"_setsandmaps_{sh}.parquet" for sh in sheets}
+    if all(_maps_cache_stamp(c) == stamp for c in caches.values()):
+        return [pd.read_parquet(caches[sh]) for sh in sheets]
+
+    frames = []
+    with pd.ExcelFile(path, engine="openpyxl") as xl:  # one zip/XML open for all sheets
+        for sh in sheets:
+            frame = pd.read_excel(xl, sheet_name=sh)
+            for c in frame.columns[frame.dtypes == object]:
+                if pd.api.types.infer_dtype(frame[c], skipna=True).startswith("mixed"):
+                    frame[c] = frame[c].astype("string")
+            try:
+                cached = pa.Table.from_pandas(frame, preserve_index=False)
+                meta = {**(cached.schema.metadata or {}), _MAPS_STAMP_KEY: stamp}
+                pq.write_table(cached.replace_schema_metadata(meta), caches[sh])
+            except Exception as e:
+                print(f"⚠ could not cache {sh}: {e}")
+            frames.append(frame)
+    return frames
+
+
 print("📥 reading raw data file")
-df = pd.read_csv(RAW_PATH, low_memory=False)
+# Multithreaded Arrow parser; label columns arrive dictionary-encoded (categorical).
+# SATIMGE is read as text so GAMS 'Eps' (zero) can be resolved before the float cast.
+_label = pa.dictionary(pa.int32(), pa.string())
+table = pacsv.read_csv(
+    RAW_PATH,
+    read_options=pacsv.ReadOptions(block_size=64 << 20),
+    convert_options=pacsv.ConvertOptions(
+        column_types={"SATIMGE": pa.string(), "Scenario": _label, "Indicator": _label,
+                      "Process": _label, "Commodity": _label},
+        strings_can_be_null=True,  # empty cells → NaN, as with pd.read_csv
+    ),
+)
+satimge = table["SATIMGE"]
+table = table.set_column(
+    table.schema.get_field_index("SATIMGE"),
+    "SATIMGE",
+    pc.if_else(pc.equal(satimge, "Eps"), "0", satimge).cast(pa.float64()),
+)
+df = table.to_pandas(split_blocks=True, self_destruct=True)
+del table, satimge
 
 print("📚 reading SetsAndMaps")
-mapPRC_df = pd.read_excel(path_setsandmaps, sheet_name="mapPRC")
-mapCOM_df = pd.read_excel(path_setsandmaps, sheet_name="mapCOM")
+mapPRC_df, mapCOM_df = read_setsandmaps(path_setsandmaps)
 
 print("🔄 applying sets and maps")
 proc_df = apply_mapping_and_clean(df, mapPRC_df, mapCOM_df)
@@ -39,14 +111,7 @@ if "Sector" not in proc_df.columns:
 
 proc_df["Sector"] = proc_df["Sector"].astype("string").fillna("Unknown")
 
-def _safe_sector_group(x):
-    try:
-        s = "" if (x is None or (isinstance(x, float) and np.isnan(x))) else str(x)
-        return map_sector_group(s)
-    except Exception:
-        return "Unknown"
-
-proc_df["SectorGroup"] = proc_df["Sector"].apply(_safe_sector_group)
+proc_df["SectorGroup"] = map_sector_group_vec(proc_df["Sector"])
 
 # ── Create CO2eq from gases (uses SATIMGE × GWP for known gases)
 print("⚖ calculating CO2eq")
@@ -54,45 +119,61 @@ GWP = {"CO2": 1, "CO2eq": 1, "CH4": 28, "N2O": 265, "CF4": 6630, "C2F6": 11100}
 if "Indicator" not in proc_df.columns or "SATIMGE" not in proc_df.columns:
     raise KeyError("Expected columns 'Indicator' and 'SATIMGE' not found after mapping.")
 
-proc_df["CO2eq"] = proc_df.apply(
-    lambda r: r["SATIMGE"] * GWP.get(r["Indicator"], 0)
-    if pd.notna(r["Indicator"])
-    else np.nan,
-    axis=1,
-)
+# Look GWP up once per distinct Indicator and broadcast through the codes.
+# Unknown gases weigh 0; a missing Indicator (code -1) picks the trailing NaN.
+codes, indicators = pd.factorize(proc_df["Indicator"])
+gwp = pd.Series(indicators).map(GWP).fillna(0).to_numpy(float)
+proc_df["CO2eq"] = proc_df["SATIMGE"] * np.append(gwp, np.nan)[codes]
 
 # ── Scenario metadata
 print("🗂 adding scenario metadata")
 if "Scenario" not in proc_df.columns:
     raise KeyError("Expected column 'Scenario' not found after mapping.")
 
-proc_df["ScenarioFamily"] = proc_df["Scenario"].apply(map_scenario_family)
-proc_df["ScenarioGroup"] = proc_df["ScenarioFamily"].apply(
-    lambda s: "CPP" if isinstance(s, str) and s.startswith("CPP") else s
-)
+# ScenarioFamily, ScenarioGroup, CarbonBudget, EconomicGrowth from one factorize
+proc_df = add_scenario_metadata(proc_df)
 
-proc_df = extract_carbon_budget(proc_df)
-proc_df["EconomicGrowth"] = proc_df["Scenario"].apply(map_economic_growth)
+# ── Downcast measures to float32 (computed in float64 above; ~7 significant digits
+# is ample for charting and halves the column size). CarbonBudget stays as-is while
+# it mixes numbers with the "NoBudget" label.
+for c in ("SATIMGE", "CO2eq", "CarbonBudget"):
+    if c in proc_df.columns and pd.api.types.is_float_dtype(proc_df[c]):
+        proc_df[c] = proc_df[c].astype("float32", copy=False)
 
 # ── Robust parquet fix ───────────────────────────────────────────────────────
-# 1) Convert any pandas 'category' columns to string
-cat_cols = proc_df.select_dtypes(include=["category"]).columns
-for c in cat_cols:
-    proc_df[c] = proc_df[c].astype("string")
-
-# 2) Convert ALL object columns to string (handles mixed int/str like IPCC_Category_L2)
+# Object columns to string (handles mixed int/str like IPCC_Category_L2). No
+# whole-frame convert_dtypes pass: the dtypes are already set above, and it would
+# also turn integral-valued float columns into ints.
 obj_cols = proc_df.select_dtypes(include=["object"]).columns
 for c in obj_cols:
     proc_df[c] = proc_df[c].astype("string")
 
-# Convert to Arrow-backed dtypes where possible before saving
-proc_df = proc_df.convert_dtypes(dtype_backend="pyarrow")
-
 # ── Save
-print(f"💾 writing CSV → {OUT_CSV}")
-proc_df.to_csv(OUT_CSV, index=False)
-
+out_table = pa.Table.from_pandas(proc_df, preserve_index=False)
+# Categoricals arrive as dictionary arrays; store them as plain strings (cast in
+# Arrow, not per row in pandas) so readers keep getting string columns. Parquet
+# dictionary-encodes the pages either way.
+out_table = out_table.cast(pa.schema([
+    f.with_type(pa.string()) if pa.types.is_dictionary(f.type) else f
+    for f in out_table.schema
+]))
+
+if (get_config().get("dataset", {}) or {}).get("emit_csv", False):
+    print(f"💾 writing CSV → {OUT_CSV}")
+    pacsv.write_csv(out_table, OUT_CSV)
+
+# Dictionary-encoded string columns + zstd; row-group statistics let filtered
+# chart reads skip groups
 print(f"💾 writing Parquet → {OUT_PARQUET}")
-proc_df.to_parquet(OUT_PARQUET, index=False)
+pq.write_table(
+    out_table,
+    OUT_PARQUET,
+    compression="zstd",
+    compression_level=3,
+    use_dictionary=True,
+    row_group_size=512_000,
+    data_page_size=1 << 20,
+    write_statistics=True,
+)
 
 print("✅ dataset build complete")
@@ -1,5 +1,8 @@
 # --- utils/mappings.py ---
 
+import numpy as np
+import pandas as pd
+
 def apply_mapping_and_clean(df, mapPRC_df, mapCOM_df):
     """
     Cleans and merges the main report DataFrame with process and commodity mappings.
@@ -12,18 +15,44 @@ def apply_mapping_and_clean(df, mapPRC_df, mapCOM_df):
     Returns:
         pd.DataFrame: Cleaned and merged DataFrame.
     """
-    # Replace 'Eps' with 0 and convert to float
-    df['SATIMGE'] = df['SATIMGE'].replace('Eps', 0).astype(float)
+    # Replace 'Eps' with 0 and convert to float (skipped when the reader already did)
+    if not pd.api.types.is_float_dtype(df['SATIMGE']):
+        df['SATIMGE'] = df['SATIMGE'].replace('Eps', 0).astype(float)
 
     # Merge mappings
-    merged_df = df.merge(mapPRC_df, on='Process', how='left')
-    merged_df = merged_df.merge(mapCOM_df, on='Commodity', how='left')
+    merged_df = _lookup_merge(df, mapPRC_df, 'Process')
+    merged_df = _lookup_merge(merged_df, mapCOM_df, 'Commodity')
 
     # Reset index
-    merged_df.reset_index(drop=True, inplace=True)
+    if not merged_df.index.equals(pd.RangeIndex(len(merged_df))):
+        merged_df.reset_index(drop=True, inplace=True)
 
     return merged_df
 
+
+def _lookup_merge(df, map_df, key):
+    """
+    Left-merge a small mapping table onto `df` on `key` without a hash join over `df`.
+    Each distinct key is looked up once and the mapping columns are gathered by position.
+    Falls back to DataFrame.merge when that would give a different result: duplicate
+    mapping keys (row fan-out), missing keys on both sides (merge matches NaN to NaN)
+    and clashing column names (_x/_y suffixes).
+    """
+    cols = [c for c in map_df.columns if c != key]
+    if map_df[key].isna().any() and not df[key].isna().any():
+        map_df = map_df[map_df[key].notna()]  # blank sheet rows can't match anything
+    keys = map_df[key]
+    if keys.duplicated().any() or keys.isna().any() or set(cols) & set(df.columns):
+        return df.merge(map_df, on=key, how='left')
+
+    codes, uniques = pd.factorize(df[key])
+    pos = pd.Index(keys).get_indexer(uniques)
+    rows = np.append(pos, -1)[codes]  # -1: no mapping (or missing key) → NaN
+    out = df.copy(deep=False)
+    for col in cols:
+        out[col] = pd.api.extensions.take(map_df[col].array, rows, allow_fill=True)
+    return out
+
 def map_scenario_key(scenario):
     scenario = scenario.strip()
 
@@ -88,28 +117,37 @@ def map_sector_group(sector):
     else:
         return 'All others'
 
+# carbon budget mapping using integers
+CARBON_BUDGETS = {
+'075':7.5,
+'0775':7.75,
+'08':8,
+'8':8,
+'0825':8.25,
+'085':8.5,
+'0875':8.75,
+'09':9,
+'0925':9.25,
+'095':9.5,
+'0975':9.75,
+'10':10,
+'1025':10.25,
+'105':10.5
+}
+
+
+def _carbon_budgets(scenarios):
+    """Budget (float, NaN when none) for each scenario name in `scenarios`."""
+    numbers = pd.Series(scenarios, dtype=object).str.extract(r'(\d{2,4})', expand=False)
+    return numbers.map(CARBON_BUDGETS).to_numpy(float)
+
+
 def extract_carbon_budget(df):
-    # carbon budget mapping using integers
-    carbonbudget_map = {
-    '075':7.5,
-    '0775':7.75,    
-    '08':8,
-    '8':8,
-    '0825':8.25,
-    '085':8.5,
-    '0875':8.75,
-    '09':9,
-    '0925':9.25,
-    '095':9.5,
-    '0975':9.75,
-    '10':10,
-    '1025':10.25,
-    '105':10.5
-    }
-    df['number_str'] = df['Scenario'].str.extract(r'(\d{2,4})', expand=False)
-    df['CarbonBudget'] = df['number_str'].map(carbonbudget_map).fillna("NoBudget")
-    df.drop(columns=['number_str'], inplace=True) #remove this column
-    
+    # extract once per distinct scenario, then broadcast back through the codes
+    codes, scenarios = pd.factorize(df['Scenario'])
+    budget = np.append(_carbon_budgets(scenarios), np.nan)[codes]  # code -1 → NaN
+    df['CarbonBudget'] = pd.Series(budget, index=df.index).fillna("NoBudget")
+
     return df
 
 
@@ -127,3 +165,110 @@ def map_economic_growth(scenario):
     else:
         return 'Unknown'
 
+
+# ── Vectorised versions for whole columns (same rules and precedence as above)
+# Rules run on the distinct values only and are expanded back through integer
+# codes, so the cost scales with #scenarios/#sectors rather than #rows.
+# Results are categorical.
+
+# (substring, label) rules in precedence order, optional exact (value, label)
+# checked first on the stripped string, and the default label
+SCENARIO_FAMILY_RULES = (
+    [('CPP4', 'CPP4 Variant'),
+     ('CPP1', 'CPP1'),
+     ('CPP2', 'CPP2'),
+     ('CPP3', 'CPP3'),
+     ('HCARB', 'High Carbon'),
+     ('LCARB', 'Low Carbon'),
+     ('BASE', 'WEM')],
+    'Other',
+    ('CPP4', 'CPP4'),
+)
+SECTOR_GROUP_RULES = (
+    [('Industry', 'Industry'),
+     ('Process emissions', 'Industry'),
+     ('Transport', 'Transport'),
+     ('Refineries', 'Refineries'),
+     ('Power', 'Power')],
+    'All others',
+    None,
+)
+ECONOMIC_GROWTH_RULES = (
+    [('-RG', 'Reference'), ('-LG', 'Low'), ('-HG', 'High')],
+    'Unknown',
+    None,
+)
+
+
+def _broadcast(codes, labels, na_label, index):
+    """
+    Categorical Series of labels[code] per row; code -1 (missing) gets `na_label`
+    (stays missing when it is None).
+    """
+    labels = np.asarray(labels, dtype=object)
+    if na_label is not None:
+        labels = np.append(labels, na_label)  # code -1 picks the last entry
+    cats = pd.unique(labels)
+    label_codes = pd.Index(cats).get_indexer(labels)
+    out = label_codes[codes]
+    if na_label is None:
+        out[codes < 0] = -1
+    return pd.Series(pd.Categorical.from_codes(out, categories=cats), index=index)
+
+
+def _expand_codes(series, labels_fn, na_label):
+    """Label each distinct value of `series` with `labels_fn`, then broadcast via codes."""
+    codes, uniques = pd.factorize(series)
+    return _broadcast(codes, labels_fn(pd.Series(uniques)), na_label, series.index)
+
+
+def _contains_labels(values, rules, default, exact=None):
+    """
+    First matching (substring, label) rule per value, like the if/elif chains above.
+    `exact` is an optional (value, label) checked against the stripped string first.
+    Missing values fall through to `default`.
+    """
+    s = pd.Series(values).astype("string")
+    conds, choices = [], []
+    if exact is not None:
+        conds.append((s.str.strip() == exact[0]).fillna(False).to_numpy(bool))
+        choices.append(exact[1])
+    for key, value in rules:
+        conds.append(s.str.contains(key, regex=False, na=False).to_numpy(bool))
+        choices.append(value)
+    return np.select(conds, choices, default)
+
+
+def _group_labels(families):
+    """ScenarioGroup per family: every CPP* family collapses to 'CPP'."""
+    s = pd.Series(families).astype("string")
+    return np.where(s.str.startswith("CPP").fillna(False).to_numpy(bool), "CPP", s.to_numpy(object))
+
+
+def _select_contains(series, rules, default, exact=None):
+    return _expand_codes(series, lambda u: _contains_labels(u, rules, default, exact), default)
+
+
+def map_sector_group_vec(series):
+    return _select_contains(series, *SECTOR_GROUP_RULES)
+
+
+def add_scenario_metadata(df):
+    """
+    Add ScenarioFamily, ScenarioGroup, CarbonBudget and EconomicGrowth from 'Scenario'
+    in one pass: the column is factorized once, every rule runs on the distinct
+    scenario names, and each result is scattered back through the shared codes.
+    Same values as map_scenario_family, map_economic_growth and extract_carbon_budget.
+    """
+    codes, uniques = pd.factorize(df['Scenario'])
+    family = _contains_labels(uniques, *SCENARIO_FAMILY_RULES)
+    fam_default = SCENARIO_FAMILY_RULES[1]
+
+    df['ScenarioFamily'] = _broadcast(codes, family, fam_default, df.index)
+    df['ScenarioGroup'] = _broadcast(codes, _group_labels(family), _group_labels([fam_default])[0], df.index)
+    budget = np.append(_carbon_budgets(uniques), np.nan)[codes]  # code -1 → NaN
+    df['CarbonBudget'] = pd.Series(budget, index=df.index).fillna("NoBudget")
+    df['EconomicGrowth'] = _broadcast(
+        codes, _contains_labels(uniques, *ECONOMIC_GROWTH_RULES), ECONOMIC_GROWTH_RULES[1], df.index
+    )
+    return df